@@ -1,50 +1,377 @@
-from random import choice, choices
+from __future__ import annotations
+import random
+from random import Random
+from array import array
 from string import ascii_uppercase
 import numpy as np
-from itertools import chain, permutations, combinations
-from typing import Callable, Tuple
-from statistics import mean
-from collections import Counter
-import matplotlib.pyplot as plt
-import networkx as nx
-from os import path, system
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Tuple
+from collections import Counter, deque
+from os import path, stat, makedirs, replace
+from hashlib import sha1
+from shutil import rmtree
+from tempfile import mkdtemp
+from mmap import mmap, ACCESS_READ
+from io import BytesIO, StringIO
+from sys import intern
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing, redirect_stdout
+from glob import glob
+import json
+import re
+
+# plotting libraries are slow to import, draw and histogram_degree import them when called
+if TYPE_CHECKING:
+    import networkx as nx
+
+# folder where parsed interactomes are cached, see cache_path
+CACHE_DIR: str = ".interactome_cache"
+# bumped whenever the layout of cached files changes
+CACHE_VERSION: int = 1
+# a line of an interaction file which is not made of exactly two words
+MALFORMED_LINE = re.compile(
+    rb'^(?![^\S\n]*\S+[^\S\n]+\S+[^\S\n]*$)[^\n]*$', re.MULTILINE)
+
+
+def cache_path(filename: str) -> str:
+    """Gives the folder where the parsed interactome of a file is cached
 
+    Args:
+        filename (str): path to an interactome file
 
-def is_interaction_file(filename: str) -> bool:
-    """Checks if file is correct
+    Returns:
+        str: cache folder, one per absolute path of the file
+    """
+    return path.join(CACHE_DIR, sha1(path.abspath(filename).encode()).hexdigest()[:16])
 
-    Raises:
-        ValueError: happens if any line is badly formatted
-        AssertionError: happens if number of lines is not correct
-        TypeError: happens if first line is not a int
-        FileNotFoundError: happens if file does not exists
+
+def cache_key(filename: str) -> np.ndarray:
+    """Identifies the state of a file on disk
+
+    Args:
+        filename (str): path to an interactome file
+
+    Returns:
+        np.ndarray: cache version, size and modification time of the file
+    """
+    status = stat(filename)
+    return np.array([CACHE_VERSION, status.st_size, status.st_mtime_ns], dtype=np.int64)
+
+
+def is_cache_fresh(filename: str) -> bool:
+    """Checks if the cache of a file exists and matches the file on disk
+
+    Args:
+        filename (str): path to an interactome file
+
+    Returns:
+        bool: True if the cache can be loaded instead of parsing the file
+    """
+    key_file: str = path.join(cache_path(filename), "key.npy")
+    if not path.exists(filename) or not path.exists(key_file):
+        return False
+    return bool(np.array_equal(np.load(key_file), cache_key(filename)))
+
+
+def read_buffer(filename: str) -> mmap | bytes:
+    """Maps a file in memory, to be checked and parsed without reading it twice
+
+    Args:
+        filename (str): path to a file
+
+    Returns:
+        mmap | bytes: read-only content of the file
+    """
+    with open(filename, 'rb') as handler:
+        try:
+            return mmap(handler.fileno(), 0, access=ACCESS_READ)
+        except ValueError:
+            # empty files cannot be mapped
+            return b''
+
+
+def interaction_file_errors(filename: str, buffer: mmap | bytes) -> list[Exception]:
+    """Lists every error in the content of an interaction file.
+    Lines are checked all at once with a regular expression, and counted with a vectorized search of newlines.
+
+    Args:
+        filename (str): path to the file, for messages
+        buffer (mmap | bytes): content of the file
+
+    Returns:
+        list[Exception]: TypeError if first line is not a int, ValueError listing all badly formatted lines,
+        AssertionError if number of lines is not correct. Empty if file is correct.
+    """
+    errors: list[Exception] = []
+    data: np.ndarray = np.frombuffer(buffer, dtype=np.uint8)
+    header_end: int = buffer.find(b'\n')
+    header: bytes = bytes(buffer[:header_end if header_end >= 0 else len(buffer)])
+    if not header.strip().isdigit():
+        errors.append(TypeError(f"File {filename} has incorrect first line."))
+    # a final newline does not start a new line
+    start: int = header_end+1 if header_end >= 0 else len(buffer)+1
+    end: int = len(buffer)-1 if buffer[-1:] == b'\n' else len(buffer)
+    nb_lines: int = 0
+    malformed: list[int] = []
+    if start <= end:
+        nb_lines = int(np.count_nonzero(data[start:end] == 10)) + 1
+        line, last = 2, start
+        for match in MALFORMED_LINE.finditer(buffer, start, end):
+            line += int(np.count_nonzero(data[last:match.start()] == 10))
+            last = match.start()
+            malformed.append(line)
+    if malformed:
+        errors.append(ValueError(
+            f"File {filename} contains errors on lines {', '.join(map(str, malformed))}."))
+    if not errors and nb_lines != int(header):
+        errors.append(AssertionError(
+            f"File {filename} has incorrect number of lines. Described : {nb_lines}, awaited {int(header)}"))
+    return errors
+
+
+def is_interaction_file(filename: str, buffer: mmap | bytes | None = None) -> bool:
+    """Checks if file is correct, printing every error found
+
+    Args:
+        filename (str): path to the file
+        buffer (mmap | bytes, optional): content of the file, if it was already read. Defaults to None.
 
     Returns:
         bool: status of file
     """
-    status: bool = False
-    try:
-        if not path.exists(filename):
-            raise FileNotFoundError
-        with open(filename, 'r') as handler:
-            first_line: int = int(handler.readline().replace('\n', ''))
-            for i, line in enumerate(handler):
-                if len(line.replace('\n', '').split()) != 2:
-                    raise ValueError
-            if i+1 != first_line:
-                raise AssertionError
-        status = True
-    except AssertionError:
-        print(AssertionError(
-            f"File {filename} has incorrect number of lines. Described : {i}, awaited {first_line}"))
-    except TypeError:
-        print(TypeError(f"File {filename} has incorrect first line."))
-    except ValueError:
-        print(ValueError(f"File contains error on line {i}."))
-    except FileNotFoundError:
+    if not path.isfile(filename):
         print(FileNotFoundError(f"File {filename} does not exists."))
-    finally:
-        return status
+        return False
+    errors: list[Exception] = interaction_file_errors(
+        filename, read_buffer(filename) if buffer is None else buffer)
+    for error in errors:
+        print(error)
+    return not errors
+
+
+def unique_interactions(interactions: Iterable[list[str]], report: Counter | None = None) -> Iterator[list[str]]:
+    """Streams interactions, skipping self-loops and redundant interactions
+
+    Each interaction is identified by its canonical (sorted) key, so that 'A B' and 'B A'
+    are the same edge. Keys are kept in a set, making the whole stream linear in its length.
+
+    Args:
+        interactions (Iterable[list[str]]): pairs of proteins, in file order
+        report (Counter, optional): if given, counts 'duplicates' and 'self-loops' removed. Defaults to None.
+
+    Yields:
+        list[str]: first occurrence of each interaction, in input order
+    """
+    seen: set[Tuple[str, str]] = set()
+    for interaction in interactions:
+        prot_a, prot_b = interaction
+        if prot_a == prot_b:
+            if report is not None:
+                report['self-loops'] += 1
+            continue
+        key: Tuple[str, str] = (prot_a, prot_b) if prot_a < prot_b else (
+            prot_b, prot_a)
+        if key in seen:
+            if report is not None:
+                report['duplicates'] += 1
+            continue
+        seen.add(key)
+        yield interaction
+
+
+def parse_chunk(filename: str, start: int, end: int) -> Tuple[list[str], np.ndarray, np.ndarray, Counter, int, list[int]]:
+    """Parses and cleans the lines of an interaction file between two byte offsets
+
+    Args:
+        filename (str): path to an interactome file
+        start (int): offset of the first line to parse
+        end (int): offset right after the last line to parse
+
+    Returns:
+        Tuple[list[str], np.ndarray, np.ndarray, Counter, int, list[int]]: names of the proteins of the chunk,
+        ids of both ends of its unique interactions in these names, removed duplicates and self-loops,
+        number of lines, and positions (from 0) of badly formatted lines in the chunk
+    """
+    with open(filename, 'rb') as handler:
+        handler.seek(start)
+        lines: list[str] = handler.read(end-start).decode().split('\n')
+    # a final newline does not start a new line
+    if lines[-1] == '':
+        lines.pop()
+    interactions: list[list[str]] = [line.split() for line in lines]
+    malformed: list[int] = [i for i, interaction in enumerate(
+        interactions) if len(interaction) != 2]
+    report = Counter({'duplicates': 0, 'self-loops': 0})
+    names: dict[str, int] = dict()
+    src, dst = array('i'), array('i')
+    if not malformed:
+        for prot_a, prot_b in unique_interactions(interactions, report):
+            src.append(names.setdefault(prot_a, len(names)))
+            dst.append(names.setdefault(prot_b, len(names)))
+    return list(names), np.frombuffer(src, dtype=np.int32), np.frombuffer(dst, dtype=np.int32), report, len(lines), malformed
+
+
+def reserve(buffer: np.ndarray, size: int) -> np.ndarray:
+    """Gives a writable array starting with buffer, with room for at least size items.
+    Room grows geometrically, so that appending items one at a time costs O(1) amortized.
+
+    Args:
+        buffer (np.ndarray): current items, possibly followed by free room
+        size (int): number of items the array must hold
+
+    Returns:
+        np.ndarray: buffer itself if large and writable enough, else a copy whose free room is filled by zeros
+    """
+    if len(buffer) >= size and buffer.flags.writeable:
+        return buffer
+    grown: np.ndarray = np.zeros(
+        max(size, 2*len(buffer)), dtype=buffer.dtype)
+    grown[:len(buffer)] = buffer
+    return grown
+
+
+def gather_neighbors(indptr: np.ndarray, indices: np.ndarray, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Gathers the neighbors of many nodes of a CSR adjacency in a single array
+
+    Args:
+        indptr (np.ndarray): start of the neighbors of each node in indices
+        indices (np.ndarray): neighbors of all nodes
+        ids (np.ndarray): nodes whose neighbors are gathered
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: the neighbors, and the node of ids each one is a neighbor of
+    """
+    lengths: np.ndarray = indptr[ids+1] - indptr[ids]
+    offsets: np.ndarray = np.repeat(
+        indptr[ids] - np.cumsum(lengths) + lengths, lengths)
+    return indices[offsets + np.arange(len(offsets))], np.repeat(ids, lengths)
+
+
+def bfs_distances(indptr: np.ndarray, indices: np.ndarray, sources: Iterable[int]) -> np.ndarray:
+    """Computes the distances from each source to every node by breadth-first search.
+    Each level of the search is expanded at once over the CSR adjacency.
+
+    Args:
+        indptr (np.ndarray): start of the neighbors of each node in indices
+        indices (np.ndarray): neighbors of all nodes
+        sources (Iterable[int]): ids of the sources
+
+    Returns:
+        np.ndarray: one row of distances per source, -1 for nodes out of reach
+    """
+    sources = np.asarray(sources, dtype=np.int64).reshape(-1)
+    distances: np.ndarray = np.full(
+        (len(sources), len(indptr)-1), -1, dtype=np.int32)
+    for row, source in zip(distances, sources.tolist()):
+        row[source] = 0
+        frontier: np.ndarray = np.array([source])
+        level: int = 0
+        while len(frontier):
+            level += 1
+            neighbors: np.ndarray = gather_neighbors(
+                indptr, indices, frontier)[0]
+            neighbors = neighbors[row[neighbors] < 0]
+            row[neighbors] = level
+            # large levels are found back by a scan, cheaper than sorting out repeated neighbors
+            frontier = np.flatnonzero(row == level) if len(
+                neighbors) > len(row) >> 4 else np.unique(neighbors)
+    return distances
+
+
+def bfs_summary(indptr: np.ndarray, indices: np.ndarray, sources: Iterable[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Summarizes the breadth-first searches from some sources of a connected graph,
+    without keeping a row of distances per source
+
+    Args:
+        indptr (np.ndarray): start of the neighbors of each node in indices
+        indices (np.ndarray): neighbors of all nodes
+        sources (Iterable[int]): ids of the sources
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: eccentricity of each source, sum of its distances
+        to all nodes, and for each node a lower and an upper bound of its eccentricity, from the triangle inequality
+    """
+    distances: np.ndarray = bfs_distances(indptr, indices, sources)
+    eccentricities: np.ndarray = distances.max(axis=1, initial=0)
+    return (eccentricities, distances.sum(axis=1, dtype=np.int64), distances.max(axis=0, initial=0),
+            (distances + eccentricities[:, None]).min(axis=0, initial=np.iinfo(np.int32).max))
+
+
+def bfs_closeness(indptr: np.ndarray, indices: np.ndarray, sources: Iterable[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sums the distances from some sources to the nodes they reach
+
+    Args:
+        indptr (np.ndarray): start of the neighbors of each node in indices
+        indices (np.ndarray): neighbors of all nodes
+        sources (Iterable[int]): ids of the sources
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: for each source, the sum of its distances and the number of nodes it reaches, itself included
+    """
+    distances: np.ndarray = bfs_distances(indptr, indices, sources)
+    return np.where(distances > 0, distances, 0).sum(axis=1, dtype=np.int64), (distances >= 0).sum(axis=1)
+
+
+def brandes_dependencies(indptr: np.ndarray, indices: np.ndarray, sources: Iterable[int]) -> np.ndarray:
+    """Accumulates the dependencies of Brandes' betweenness algorithm over some sources.
+    Shortest paths are counted level by level of a breadth-first search, then dependencies
+    flow back from the deepest level, each level being processed at once.
+
+    Args:
+        indptr (np.ndarray): start of the neighbors of each node in indices
+        indices (np.ndarray): neighbors of all nodes
+        sources (Iterable[int]): ids of the sources
+
+    Returns:
+        np.ndarray: sum over the sources of the dependency of each node
+    """
+    size: int = len(indptr)-1
+    total: np.ndarray = np.zeros(size)
+    for source in sources:
+        distances: np.ndarray = np.full(size, -1, dtype=np.int32)
+        paths: np.ndarray = np.zeros(size)
+        distances[source], paths[source] = 0, 1
+        # interactions going from each level to the next one
+        levels: list[Tuple[np.ndarray, np.ndarray]] = []
+        frontier: np.ndarray = np.array([source])
+        while len(frontier):
+            neighbors, owners = gather_neighbors(indptr, indices, frontier)
+            depth: int = int(distances[frontier[0]]) + 1
+            unseen: np.ndarray = neighbors[distances[neighbors] < 0]
+            distances[unseen] = depth
+            frontier = np.flatnonzero(distances == depth) if len(
+                unseen) > size >> 4 else np.unique(unseen)
+            down: np.ndarray = distances[neighbors] == depth
+            owners, neighbors = owners[down], neighbors[down]
+            paths += np.bincount(neighbors, paths[owners], size)
+            levels.append((owners, neighbors))
+        dependencies: np.ndarray = np.zeros(size)
+        for owners, neighbors in reversed(levels):
+            dependencies += np.bincount(owners, paths[owners] / paths[neighbors]
+                                        * (1 + dependencies[neighbors]), size)
+        dependencies[source] = 0
+        total += dependencies
+    return total
+
+
+def build_csr(src: np.ndarray, dst: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Builds the compressed sparse row (CSR) adjacency of an undirected graph
+
+    Args:
+        src (np.ndarray): ids of the first protein of each interaction
+        dst (np.ndarray): ids of the second protein of each interaction
+        size (int): number of proteins in the graph
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: row pointers (int64) and sorted neighbor ids (int32).
+        Neighbors of protein i are indices[indptr[i]:indptr[i+1]].
+    """
+    rows: np.ndarray = np.concatenate([src, dst]).astype(np.int32, copy=False)
+    cols: np.ndarray = np.concatenate([dst, src]).astype(np.int32, copy=False)
+    order: np.ndarray = np.lexsort((cols, rows))
+    indptr: np.ndarray = np.zeros(size+1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=size), out=indptr[1:])
+    return indptr, cols[order]
 
 
 def check_interaction_file(f: Callable) -> Callable:
@@ -65,8 +392,12 @@ def check_interaction_file(f: Callable) -> Callable:
         if 'method' in kwargs:
             if kwargs['method'] != 'default':
                 return f(*args, **kwargs)
-        if is_interaction_file(args[1]):
+        if kwargs.get('cache', True) and is_cache_fresh(args[1]):
             return f(*args, **kwargs)
+        # the file is read once, then given to f for parsing
+        buffer = read_buffer(args[1]) if path.isfile(args[1]) else None
+        if is_interaction_file(args[1], buffer):
+            return f(*args, buffer=buffer, **kwargs)
         exit()
 
     return wrapper
@@ -74,6 +405,19 @@ def check_interaction_file(f: Callable) -> Callable:
 
 class Interactome:
 
+    # the graph is held by proteins and numpy arrays of ids, other representations are views built on demand
+    __slots__ = ('__file_in', '__file_out', '__int_list', '__int_dict', '__adjacency', '__proteins', '__prot_index',
+                 '__degrees', '__edges', '__nb_edges', '__positions', '__memo', '__cleaning_report',
+                 '__added', '__removed', '__pending')
+
+    # above this number of proteins, int_mat refuses to build the dense matrix
+    DENSE_LIMIT: int = 10000
+    # above this number of drawn proteins, draw switches to the fast layout and batched edges
+    LARGE_DRAWING: int = 500
+    # neighbors added or removed since the adjacency was built are kept aside,
+    # and compacted into it past this number of changes or an eighth of the interactions
+    OVERFLOW_LIMIT: int = 1024
+
     @property
     def file_in(self):
         """ Getter of the attibute file_in. """
@@ -100,39 +444,82 @@ class Interactome:
 
     @property
     def int_list(self):
-        """ Getter of the attribute int_list. """
+        """ Getter of the attribute int_list, built from edges on first access if memory-mapped. """
+        if self.__int_list is None:
+            self.__int_list = list(self.iter_interactions())
         return self.__int_list
 
     @int_list.setter
     def int_list(self, new_int_list):
-        """ Setter of the attribute int_list. """
+        """ Setter of the attribute int_list, which replaces the interactions of the graph.
+        Proteins, edges, adjacency and degrees are built again from them, and they are cleaned. """
         if not isinstance(new_int_list, list):
             raise ValueError("Expecting a list")
-        self.__int_list = new_int_list
+        self.__load_interactions(new_int_list)
 
     @property
     def int_mat(self):
-        """ Getter of the attribute int_mat. """
-        return self.__int_mat
+        """ Getter of the attribute int_mat, a dense view of the adjacency. """
+        indptr, indices = self.adjacency
+        dim: int = len(indptr)-1
+        if dim > self.DENSE_LIMIT:
+            raise MemoryError(
+                f"Graph has {dim} nodes, dense matrix is only available up to {self.DENSE_LIMIT} nodes")
+        matrix = np.zeros([dim, dim], dtype=int)
+        matrix[np.repeat(np.arange(dim), np.diff(indptr)), indices] = 1
+        return matrix
 
     @int_mat.setter
     def int_mat(self, new_int_mat):
-        """ Setter of the attribute int_mat. """
+        """ Setter of the attribute int_mat, which replaces the interactions of the graph by the ones of the upper triangle.
+        Proteins are kept, edges, adjacency and degrees are built again as the int_list setter does. """
         if not isinstance(new_int_mat, np.ndarray):
             raise ValueError("Expecting an array")
-        self.__int_mat = new_int_mat
+        if new_int_mat.ndim != 2 or new_int_mat.shape != (len(self.proteins), len(self.proteins)):
+            raise ValueError("Expecting a square matrix of a row per protein")
+        src, dst = np.nonzero(np.triu(new_int_mat, 1))
+        self.__int_list, self.__int_dict = None, None
+        self.__index_edges(self.proteins, src.astype(np.int32), dst.astype(np.int32),
+                           Counter({'duplicates': 0, 'self-loops': int(np.count_nonzero(np.diagonal(new_int_mat)))}))
+
+    @property
+    def adjacency(self):
+        """ Getter of the attribute adjacency, as CSR (indptr, indices) arrays.
+        Rebuilt from edges if interactions were added or removed since, and padded for proteins added since. """
+        if self.__adjacency is None or self.__pending:
+            self.__adjacency = build_csr(*self.edges, len(self.proteins))
+            self.__added, self.__removed, self.__pending = dict(), dict(), 0
+        elif len(self.__adjacency[0]) <= len(self.proteins):
+            indptr, indices = self.__adjacency
+            self.__adjacency = (np.concatenate([indptr, np.full(len(self.proteins)+1-len(indptr), indptr[-1], dtype=indptr.dtype)]),
+                                indices)
+        return self.__adjacency
+
+    @adjacency.setter
+    def adjacency(self, new_adjacency):
+        """ Setter of the attribute adjacency. """
+        if new_adjacency is not None and (not isinstance(new_adjacency, tuple) or len(new_adjacency) != 2 or not all(isinstance(x, np.ndarray) for x in new_adjacency)):
+            raise ValueError("Expecting a tuple of two arrays")
+        self.__adjacency = new_adjacency
+        self.__added, self.__removed, self.__pending = dict(), dict(), 0
+        self.__memo = dict()
 
     @property
     def int_dict(self):
-        """ Getter of the attribute int_dict. """
+        """ Getter of the attribute int_dict, built from edges on first access if memory-mapped. """
+        if self.__int_dict is None:
+            self.__int_dict = dict()
+            for prot_a, prot_b in self.iter_interactions():
+                self.__int_dict.setdefault(prot_a, []).append(prot_b)
         return self.__int_dict
 
     @int_dict.setter
     def int_dict(self, new_int_dict):
-        """ Setter of the attribute int_dict. """
+        """ Setter of the attribute int_dict, which replaces the interactions of the graph as the int_list setter does. """
         if not isinstance(new_int_dict, dict):
             raise ValueError("Expecting a dict")
-        self.__int_dict = new_int_dict
+        self.__load_interactions((prot_a, prot_b) for prot_a, prots in new_int_dict.items()
+                                 for prot_b in prots)
 
     @property
     def proteins(self):
@@ -146,8 +533,69 @@ class Interactome:
             raise ValueError("Expecting a list")
         self.__proteins = new_proteins
 
+    @property
+    def prot_index(self):
+        """ Getter of the attribute prot_index, mapping each protein to its position in proteins. """
+        return self.__prot_index
+
+    @prot_index.setter
+    def prot_index(self, new_prot_index):
+        """ Setter of the attribute prot_index. """
+        if not isinstance(new_prot_index, dict):
+            raise ValueError("Expecting a dict")
+        self.__prot_index = new_prot_index
+
+    @property
+    def degrees(self):
+        """ Getter of the attribute degrees, the degree of each protein in proteins order.
+        Proteins added since have no interaction yet. """
+        if len(self.__degrees) < len(self.proteins):
+            self.__degrees = reserve(self.__degrees, len(self.proteins))
+        return self.__degrees[:len(self.proteins)]
+
+    @degrees.setter
+    def degrees(self, new_degrees):
+        """ Setter of the attribute degrees. """
+        if not isinstance(new_degrees, np.ndarray):
+            raise ValueError("Expecting an array")
+        self.__degrees = new_degrees
+
+    @property
+    def edges(self):
+        """ Getter of the attribute edges, ids of both ends of each interaction, in int_list order. """
+        # arrays may have free room for interactions to come, see reserve
+        return tuple(ids[:self.__nb_edges] for ids in self.__edges)
+
+    @edges.setter
+    def edges(self, new_edges):
+        """ Setter of the attribute edges. """
+        if not isinstance(new_edges, tuple) or len(new_edges) != 2:
+            raise ValueError("Expecting a tuple of two arrays")
+        self.__edges = new_edges
+        self.__nb_edges = len(new_edges[0])
+        self.__positions = None
+        # results computed on the previous graph are dropped
+        self.__memo = dict()
+
+    @property
+    def flat_list(self):
+        """ Getter of the attribute flat_list, all proteins resp. to their interactions. """
+        return list(chain(*self.iter_interactions()))
+
+    @property
+    def cleaning_report(self):
+        """ Getter of the attribute cleaning_report. """
+        return self.__cleaning_report
+
+    @cleaning_report.setter
+    def cleaning_report(self, new_cleaning_report):
+        """ Setter of the attribute cleaning_report. """
+        if not isinstance(new_cleaning_report, Counter):
+            raise ValueError("Expecting a Counter")
+        self.__cleaning_report = new_cleaning_report
+
     @check_interaction_file
-    def __init__(self, file: str, fileout="clean_int_graph.txt", method='default', kwargs={}):
+    def __init__(self, file: str, fileout="clean_int_graph.txt", method='default', kwargs={}, write_clean: bool = True, cache: bool = True, buffer=None):
         """Creates a list and a dictionary from the interactome file as well as the list of ordered proteins.
 
         Parameters
@@ -155,37 +603,64 @@ class Interactome:
             file (str): A path to an interactome file in txt format
             fileout (str, optional) : Output path for a cleaned interactome txt file
             method (str, optional): Alternative methods to generate graphs. Defaults to 'default'.
+                'stream' reads the file only once, checking its format while loading it.
+                'mmap' memory-maps the arrays of the cache of the file instead of loading them,
+                int_list and int_dict are then only built if accessed.
+                'parallel' parses the file with a pool of processes, configured by kwargs
+                (see read_interactome_parallel).
             kwargs (dict, optional): Additionnal arguments for alternative methods. Defaults to {}.
+            write_clean (bool, optional): Writes the cleaned interactome to fileout. Defaults to True.
+            cache (bool, optional): Loads the interactome from its binary cache when it is fresh,
+                and creates the cache otherwise. Defaults to True.
+            buffer (mmap | bytes, optional): Content of file, given by check_interaction_file once checked. Defaults to None.
         """
         match method:
-            case 'default':
+            case 'default' | 'stream' | 'mmap' | 'parallel':
                 # path to input.txt file
                 self.file_in = file
                 # path to output.txt file
                 self.file_out = fileout
+                # interactions as list and dict, proteins and their ids, adjacency and degrees
+                mmap_mode: str | None = 'r' if method == 'mmap' else None
+                if not ((cache or mmap_mode) and self.load_cache(mmap_mode)):
+                    try:
+                        if method == 'parallel':
+                            self.read_interactome_parallel(**kwargs)
+                        else:
+                            self.read_interactome(
+                                validate=method != 'default', buffer=buffer)
+                    except (ValueError, AssertionError) as error:
+                        print(error)
+                        exit()
+                    if cache or mmap_mode:
+                        self.save_cache()
+                    if mmap_mode and not self.load_cache(mmap_mode):
+                        exit(f"Could not write the cache of {file}, which is needed to memory-map it.")
                 # interactome file cleaning
-                self.write_clean_interactome()
-                # interactions as list and dict
-                self.int_list, self.int_dict = self.read_interaction_file()
-                # matrix of distance and list of proteins in interactome
-                self.int_mat, self.proteins = self.read_interaction_file_mat()
-                # list of all proteins, resp. to their interactions
-                self.flat_list = list(chain(*self.int_list))
-            case 'erdos-renyi':
-                self.proteins = []
-                self.__save_graph(self.erdos_renyi_graph(**kwargs))
-                self.__init__(".temp_graph.txt", method='default')
-                system("rm .temp_graph.txt")
-            case 'barabasi-albert':
-                self.int_list, self.int_dict = [], {}
-                self.int_mat, self.proteins = np.ndarray([]), []
-                self.flat_list = []
-                self.__save_graph(self.__barabasi_albert(**kwargs))
-                self.__init__(".temp_graph.txt", method='default')
-                system("rm .temp_graph.txt")
+                if write_clean:
+                    self.write_clean_interactome(self.iter_interactions())
+            case 'erdos-renyi' | 'barabasi-albert':
+                # generated graphs have no input file, proteins and interactions are generated in an empty graph
+                self.file_in, self.file_out = "", fileout
+                self.__int_list, self.__int_dict = None, None
+                self.proteins, self.prot_index = [], {}
+                self.degrees = np.zeros(0, dtype=np.int64)
+                self.edges = (np.zeros(0, dtype=np.int32),
+                              np.zeros(0, dtype=np.int32))
+                self.adjacency = None
+                if method == 'erdos-renyi':
+                    # ids of generated edges are indexed as they are, without going through names
+                    self.__index_named(*self.__erdos_renyi(**kwargs),
+                                       Counter({'duplicates': 0, 'self-loops': 0}))
+                else:
+                    self.__barabasi_albert(**kwargs)
+                    self.__index_named(self.proteins, *self.edges,
+                                       Counter({'duplicates': 0, 'self-loops': 0}))
+                if write_clean:
+                    self.write_clean_interactome(self.iter_interactions())
 
     def __str__(self):
-        return f"Interactome object with {len(self.proteins)} nodes and {len(self.int_list)} interactions."
+        return f"Interactome object with {self.count_vertices()} nodes and {self.count_edges()} interactions."
 
     def __no_color(self, graph: nx.Graph):
         return [0 for _ in list(graph.nodes())]
@@ -194,41 +669,169 @@ class Interactome:
         return [len(graph.adj[node]) for node in list(graph.nodes())]
 
     def color_by_connectivity(self, graph: nx.Graph):
-        components: list = [
-            list(x) for x in nx.algorithms.components.connected_components(graph)]
-        flattened: list = [item for sublist in components for item in sublist]
-        codes: list = [i for i, sublist in enumerate(
-            components) for _ in sublist]
-        return [codes[flattened.index(node)] for node in list(graph.nodes())]
-
-    def draw(self, method: Callable = __no_color, colormap=plt.cm.Purples):
-        plt.cla()
-        graph = nx.Graph()
-        for prot_a, prot_b in self.int_list:
-            graph.add_edge(prot_a, prot_b)
+        labels: np.ndarray = self.label_CC()
+        return labels[[self.prot_index[node] for node in graph.nodes()]].tolist()
 
-        colors = method(self, graph)
+    def draw(self, method: Callable = __no_color, colormap=None, large: bool | None = None, components: int | None = None, min_degree: int | None = None):
+        """Draws the graph, colored by method. The networkx graph and the layout are computed once
+        per selection of proteins, until interactions are changed.
 
-        options = {
-            "font_size": 6,
-            "node_size": 300,
-            "cmap": colormap,
-            "node_color": colors,
-            "edgecolors": "black",
-            "linewidths": 1,
-            "width": 1,
-        }
-
-        nx.draw_networkx(graph, None, **options)
+        Parameters
+        ----------
+        method : Callable, optional
+            Gives the colors of the nodes of the networkx graph, by default no color
+        colormap : Colormap, optional
+            Colormap of the nodes, by default Purples
+        large : bool | None, optional
+            Draws with a fast layout, edges in a single LineCollection and no labels,
+            by default if more than LARGE_DRAWING proteins are drawn
+        components : int | None, optional
+            Only draws the proteins of the k largest paths, by default all of them
+        min_degree : int | None, optional
+            Only draws the proteins having at least this degree, by default all of them
+        """
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from matplotlib.collections import LineCollection
+        if colormap is None:
+            colormap = plt.cm.Purples
+        graph, src, dst = self.__drawing(components, min_degree)
+        if large is None:
+            large = graph.number_of_nodes() > self.LARGE_DRAWING
+        key: tuple = ('layout', components, min_degree, large)
+        if key not in self.__memo:
+            if large:
+                self.__memo[key] = self.__fast_layout(
+                    graph.number_of_nodes(), src, dst)
+            else:
+                layout: dict = nx.spring_layout(graph)
+                self.__memo[key] = np.array(
+                    [layout[node] for node in graph.nodes()]).reshape(-1, 2)
+        positions: np.ndarray = self.__memo[key]
 
+        colors = method(self, graph)
+        plt.cla()
         ax = plt.gca()
+        if large:
+            ax.add_collection(LineCollection(np.stack(
+                [positions[src], positions[dst]], axis=1), colors="grey", linewidths=0.3, alpha=0.5))
+            ax.scatter(positions[:, 0], positions[:, 1], s=8, c=colors,
+                       cmap=colormap, edgecolors="black", linewidths=0.2, zorder=2)
+            ax.autoscale()
+        else:
+            options = {
+                "font_size": 6,
+                "node_size": 300,
+                "cmap": colormap,
+                "node_color": colors,
+                "edgecolors": "black",
+                "linewidths": 1,
+                "width": 1,
+            }
+
+            nx.draw_networkx(graph, dict(
+                zip(graph.nodes(), positions)), **options)
+
         ax.margins(0.20)
         plt.axis("off")
         plt.show()
 
+    def __drawing(self, components: int | None, min_degree: int | None) -> Tuple[nx.Graph, np.ndarray, np.ndarray]:
+        """Builds the networkx graph of the proteins to draw, once per selection
+
+        Parameters
+        ----------
+        components : int | None
+            Only keeps the proteins of the k largest paths if given
+        min_degree : int | None
+            Only keeps the proteins having at least this degree if given
+
+        Returns
+        -------
+        Tuple[nx.Graph, np.ndarray, np.ndarray]
+            The graph, and both ends of its edges as positions in graph.nodes()
+        """
+        key: tuple = ('drawing', components, min_degree)
+        if key not in self.__memo:
+            import networkx as nx
+            keep: np.ndarray = np.ones(self.count_vertices(), dtype=bool)
+            if components is not None:
+                labels: np.ndarray = self.label_CC()
+                sizes: np.ndarray = np.bincount(labels)[1:]
+                largest: np.ndarray = np.argsort(
+                    -sizes, kind='stable')[:components] + 1
+                keep &= np.isin(labels, largest)
+            if min_degree is not None:
+                keep &= self.degrees >= min_degree
+            ids: np.ndarray = np.flatnonzero(keep)
+            local: np.ndarray = np.full(len(keep), -1, dtype=np.int64)
+            local[ids] = np.arange(len(ids))
+            src, dst = self.edges
+            kept: np.ndarray = keep[src] & keep[dst]
+            src, dst = local[src[kept]], local[dst[kept]]
+            names: list[str] = [self.proteins[i] for i in ids.tolist()]
+            graph = nx.Graph()
+            graph.add_nodes_from(names)
+            graph.add_edges_from(
+                (names[a], names[b]) for a, b in zip(src.tolist(), dst.tolist()))
+            self.__memo[key] = (graph, src, dst)
+        return self.__memo[key]
+
+    def __fast_layout(self, size: int, src: np.ndarray, dst: np.ndarray, iterations: int = 50, sample: int = 16, seed: int = 0) -> np.ndarray:
+        """Force-directed layout in linear time per iteration : Fruchterman-Reingold where
+        the repulsion of each node is estimated from a random sample of nodes
+
+        Parameters
+        ----------
+        size : int
+            Number of nodes
+        src : np.ndarray
+            First node of each edge
+        dst : np.ndarray
+            Second node of each edge
+        iterations : int, optional
+            Number of moves of the nodes, by default 50
+        sample : int, optional
+            Number of nodes repelling the others at each iteration, by default 16
+        seed : int, optional
+            Seed of the initial positions and samples, by default 0
+
+        Returns
+        -------
+        np.ndarray
+            Positions of the nodes, one row per node
+        """
+        rng = np.random.default_rng(seed)
+        positions: np.ndarray = rng.random((size, 2))
+        if size < 2:
+            return positions
+        # ideal distance between nodes, and maximal move which decreases over time
+        k: float = 1/np.sqrt(size)
+        temperature: float = 0.1
+        for _ in range(iterations):
+            others: np.ndarray = rng.integers(size, size=min(sample, size))
+            delta: np.ndarray = positions[:, None, :] - positions[others][None]
+            distance: np.ndarray = np.maximum(
+                (delta**2).sum(axis=2), 1e-4)
+            displacement: np.ndarray = (
+                delta * (k*k/distance)[..., None]).sum(axis=1) * (size/len(others))
+            delta = positions[src] - positions[dst]
+            force: np.ndarray = delta * \
+                (np.sqrt((delta**2).sum(axis=1))/k)[:, None]
+            for axis in range(2):
+                displacement[:, axis] += np.bincount(dst, force[:, axis], size) - \
+                    np.bincount(src, force[:, axis], size)
+            length: np.ndarray = np.maximum(
+                np.sqrt((displacement**2).sum(axis=1)), 1e-9)
+            positions += displacement * \
+                (np.minimum(length, temperature)/length)[:, None]
+            temperature -= 0.1/(iterations+1)
+        return positions
+
     def clean_interactome(self) -> Tuple[list[Tuple[str, str]], int]:
         """Cleans data from file by removing redundant interactions.
-         Count the number of interactions
+         Count the number of interactions. The number of removed duplicates and self-loops
+         is stored in cleaning_report.
 
         Parameters
         ----------
@@ -240,28 +843,326 @@ class Interactome:
         list, int
             List of non redundant interactions, number of interactions.
         """
-        list_interactions = list()
+        report = Counter({'duplicates': 0, 'self-loops': 0})
         with open(self.file_in, "r") as f:
             next(f)
-            for line in f:
-                line_interaction = line.split()
-                if line_interaction[::-1] not in list_interactions and line_interaction[0] != line_interaction[1] and line_interaction not in list_interactions:
-                    list_interactions.append(line_interaction)
+            list_interactions = list(unique_interactions(
+                (line.split() for line in f), report))
+        self.cleaning_report = report
         return list_interactions, len(list_interactions)
 
-    def write_clean_interactome(self) -> None:
+    def write_clean_interactome(self, list_interactions: Iterable | None = None) -> None:
         """ Writes the cleaned data to the output file.
         Parameters
         ----------
-        filein : str
-            The interactome file to clean.
-        fileout : str
-            The cleaned interactome file
+        list_interactions : Iterable, optional
+            The interactions of the graph, written as they are iterated.
+            If not given, the input file is cleaned again.
         """
-        list_interactions, nb_interactions = self.clean_interactome()
+        if list_interactions is None:
+            list_interactions, nb_interactions = self.clean_interactome()
+        else:
+            nb_interactions = self.count_edges()
         with open(self.file_out, 'w') as handler:
-            handler.write('\n'.join(
-                [str(nb_interactions)]+[f"{key} {value}" for (key, value) in list_interactions]))
+            handler.write(str(nb_interactions))
+            handler.writelines(
+                f"\n{key} {value}" for (key, value) in list_interactions)
+
+    def read_interactome(self, validate: bool = False, buffer: mmap | bytes | None = None) -> None:
+        """Reads the interactome file once and builds everything from that single pass:
+        proteins and prot_index, edges, adjacency, degrees and cleaning_report.
+
+        Parameters
+        ----------
+        validate : bool, optional
+            Checks the file format while reading, by default False
+        buffer : mmap | bytes, optional
+            Content of the file if it was already read, by default None
+
+        Raises
+        ------
+        ValueError
+            If validate and the first line is not an int or a line is badly formatted
+        AssertionError
+            If validate and the number of lines is not the one announced
+        """
+        nb_lines: int = 0
+
+        def decoded(buffer: mmap | bytes) -> Iterator[str]:
+            # the shared buffer is read line by line, without copying it whole
+            reader = BytesIO(buffer) if isinstance(buffer, bytes) else buffer
+            reader.seek(0)
+            for line in iter(reader.readline, b''):
+                yield line.decode()
+
+        with open(self.file_in, "r") if buffer is None else closing(decoded(buffer)) as f:
+            header: str = next(f, '')
+            if validate and not header.strip().isdigit():
+                raise ValueError(
+                    f"File {self.file_in} has incorrect first line.")
+
+            def lines() -> Iterator[list[str]]:
+                nonlocal nb_lines
+                for nb_lines, line in enumerate(f, 1):
+                    interaction = line.split()
+                    if validate and len(interaction) != 2:
+                        raise ValueError(
+                            f"File {self.file_in} contains error on line {nb_lines+1}.")
+                    yield interaction
+
+            self.__load_interactions(lines())
+
+        if validate and nb_lines != int(header):
+            raise AssertionError(
+                f"File {self.file_in} has incorrect number of lines. Described : {nb_lines}, awaited {int(header)}")
+
+    @classmethod
+    def from_edges(cls, edges: Iterable, fileout: str = "clean_int_graph.txt", write_clean: bool = False) -> 'Interactome':
+        """Creates an interactome directly from its interactions, without any file.
+
+        Parameters
+        ----------
+        edges : Iterable
+            Pairs of proteins, such as a list of tuples or an array of shape (n, 2).
+            Self-loops and redundant interactions are removed.
+        fileout : str, optional
+            Output path for a cleaned interactome txt file, by default "clean_int_graph.txt"
+        write_clean : bool, optional
+            Writes the cleaned interactome to fileout, by default False
+
+        Returns
+        -------
+        Interactome
+            The interactome of the given interactions
+        """
+        if isinstance(edges, np.ndarray):
+            edges = edges.tolist()
+        graph: Interactome = cls.__new__(cls)
+        graph.file_in, graph.file_out = "", fileout
+        graph.__load_interactions(edges)
+        if write_clean:
+            graph.write_clean_interactome(graph.iter_interactions())
+        return graph
+
+    def __load_interactions(self, interactions: Iterable) -> None:
+        """Builds proteins and prot_index, edges, adjacency, degrees and cleaning_report
+        from interactions, in a single pass over them. int_list and int_dict are only built if accessed.
+
+        Parameters
+        ----------
+        interactions : Iterable
+            Pairs of proteins, in order
+        """
+        report = Counter({'duplicates': 0, 'self-loops': 0})
+        names: list[str] = []
+        first_seen: dict[str, int] = dict()
+        src, dst = array('i'), array('i')
+        # strings of a line are released as soon as its proteins are known, redundant interactions
+        # are then removed at once, keeping the first occurrence of each pair of ids as unique_interactions does
+        for prot_a, prot_b in interactions:
+            if prot_a == prot_b:
+                report['self-loops'] += 1
+                continue
+            for prot in (prot_a, prot_b):
+                if prot not in first_seen:
+                    prot = intern(prot)
+                    first_seen[prot] = len(names)
+                    names.append(prot)
+            src.append(first_seen[prot_a])
+            dst.append(first_seen[prot_b])
+        src, dst = np.frombuffer(src, dtype=np.int32), np.frombuffer(dst, dtype=np.int32)
+        keys: np.ndarray = np.minimum(src, dst).astype(
+            np.int64) << 32 | np.maximum(src, dst)
+        first: np.ndarray = np.sort(np.unique(keys, return_index=True)[1])
+        report['duplicates'] += len(src) - len(first)
+
+        self.__index_named(names, src[first], dst[first], report)
+
+    def __index_named(self, names: list[str], src: np.ndarray, dst: np.ndarray, report: Counter) -> None:
+        """Numbers proteins in alphabetical order, then indexes interactions given by positions in names (see __index_edges).
+        int_list and int_dict are only built if accessed.
+
+        Args:
+            names (list[str]): names of the proteins, in any order
+            src (np.ndarray): positions in names of the first protein of each interaction
+            dst (np.ndarray): positions in names of the second protein of each interaction
+            report (Counter): removed duplicates and self-loops
+        """
+        order: list[int] = sorted(range(len(names)), key=names.__getitem__)
+        rank: np.ndarray = np.empty(len(names), dtype=np.int32)
+        rank[order] = np.arange(len(names), dtype=np.int32)
+        self.__int_list, self.__int_dict = None, None
+        self.__index_edges([names[i] for i in order],
+                           rank[src], rank[dst], report)
+
+    def __index_edges(self, proteins: list[str], src: np.ndarray, dst: np.ndarray, report: Counter) -> None:
+        """Sets proteins and prot_index, edges, adjacency, degrees and cleaning_report of cleaned interactions
+
+        Args:
+            proteins (list[str]): sorted names of the proteins
+            src (np.ndarray): ids of the first protein of each interaction
+            dst (np.ndarray): ids of the second protein of each interaction
+            report (Counter): removed duplicates and self-loops
+        """
+        self.proteins = proteins
+        self.prot_index = {prot: i for i, prot in enumerate(self.proteins)}
+        self.edges = (src, dst)
+        self.adjacency = build_csr(src, dst, len(proteins))
+        self.degrees = np.diff(self.adjacency[0])
+        self.cleaning_report = report
+
+    def read_interactome_parallel(self, processes: int | None = None, chunk_size: int = 1 << 24) -> None:
+        """Reads the interactome file with a pool of processes, each one parsing, checking and cleaning
+        a range of lines of the file (see parse_chunk). Partial results are merged in file order,
+        so the interactome is the one read_interactome would build. int_list and int_dict are only built if accessed.
+
+        Parameters
+        ----------
+        processes : int, optional
+            Number of worker processes, by default the number of CPUs
+        chunk_size : int, optional
+            Approximate number of bytes parsed by a worker at once, by default 16 MiB
+
+        Raises
+        ------
+        ValueError
+            If the first line is not an int or lines are badly formatted
+        AssertionError
+            If the number of lines is not the one announced
+        """
+        with open(self.file_in, "rb") as f:
+            header: bytes = f.readline()
+            if not header.strip().isdigit():
+                raise ValueError(
+                    f"File {self.file_in} has incorrect first line.")
+            # chunks end right after a newline, so that no line is split
+            bounds: list[int] = [f.tell()]
+            size: int = path.getsize(self.file_in)
+            while bounds[-1] < size:
+                f.seek(min(bounds[-1]+chunk_size, size))
+                f.readline()
+                bounds.append(min(f.tell(), size))
+        ranges = list(zip(bounds[:-1], bounds[1:]))
+        if len(ranges) > 1 and processes != 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                chunks = list(pool.map(
+                    parse_chunk, *zip(*[(self.file_in, start, end) for start, end in ranges])))
+        else:
+            chunks = [parse_chunk(self.file_in, start, end)
+                      for start, end in ranges]
+
+        malformed: list[int] = []
+        # the first line of the first chunk is the second line of the file
+        first_line: int = 2
+        for _, _, _, _, nb_lines, bad_lines in chunks:
+            malformed.extend(first_line+i for i in bad_lines)
+            first_line += nb_lines
+        if malformed:
+            raise ValueError(
+                f"File {self.file_in} contains errors on lines {', '.join(map(str, malformed))}.")
+        if first_line-2 != int(header):
+            raise AssertionError(
+                f"File {self.file_in} has incorrect number of lines. Described : {first_line-2}, awaited {int(header)}")
+
+        proteins: list[str] = sorted(
+            set(map(intern, chain.from_iterable(chunk[0] for chunk in chunks))))
+        index: dict[str, int] = {prot: i for i, prot in enumerate(proteins)}
+        src, dst = [], []
+        report = Counter({'duplicates': 0, 'self-loops': 0})
+        for names, chunk_src, chunk_dst, chunk_report, _, _ in chunks:
+            ids: np.ndarray = np.fromiter(
+                (index[prot] for prot in names), dtype=np.int32, count=len(names))
+            src.append(ids[chunk_src])
+            dst.append(ids[chunk_dst])
+            report.update(chunk_report)
+        src, dst = np.concatenate(src), np.concatenate(dst)
+        # interactions repeated across chunks, only their first occurrence is kept
+        keys: np.ndarray = np.minimum(src, dst).astype(
+            np.int64)*len(proteins) + np.maximum(src, dst)
+        first: np.ndarray = np.sort(np.unique(keys, return_index=True)[1])
+        report['duplicates'] += len(src) - len(first)
+        self.__int_list, self.__int_dict = None, None
+        self.__index_edges(proteins, src[first], dst[first], report)
+
+    def save_cache(self) -> None:
+        """Saves the parsed interactome of file_in as .npy files in its cache folder.
+        The cache is written aside then moved in place, and any error while writing is ignored.
+        """
+        folder: str = cache_path(self.file_in)
+        temp: str = ""
+        try:
+            makedirs(CACHE_DIR, exist_ok=True)
+            temp = mkdtemp(dir=CACHE_DIR)
+            arrays: dict[str, np.ndarray] = {
+                'proteins': np.array(self.proteins, dtype=str),
+                'src': self.edges[0],
+                'dst': self.edges[1],
+                'indptr': self.adjacency[0],
+                'indices': self.adjacency[1],
+                'degrees': self.degrees,
+                'report': np.array([self.cleaning_report['duplicates'], self.cleaning_report['self-loops']]),
+                # written last, a cache folder without key is never considered fresh
+                'key': cache_key(self.file_in),
+            }
+            for name, data in arrays.items():
+                np.save(path.join(temp, f"{name}.npy"), data)
+            rmtree(folder, ignore_errors=True)
+            replace(temp, folder)
+        except OSError:
+            if temp:
+                rmtree(temp, ignore_errors=True)
+
+    def load_cache(self, mmap_mode: str | None = None) -> bool:
+        """Loads the parsed interactome of file_in from its cache folder, if it is fresh.
+
+        Parameters
+        ----------
+        mmap_mode : str, optional
+            If given, arrays are memory-mapped with this mode (see numpy.load) and
+            int_list and int_dict are left to be built on first access, by default None
+
+        Returns
+        -------
+        bool
+            True if the interactome was loaded from cache
+        """
+        if not is_cache_fresh(self.file_in):
+            return False
+        folder: str = cache_path(self.file_in)
+        arrays: dict[str, np.ndarray] = {name: np.load(path.join(folder, f"{name}.npy"), mmap_mode=mmap_mode) for name in [
+            'proteins', 'src', 'dst', 'indptr', 'indices', 'degrees', 'report']}
+        # protein names are the only table turned into python objects
+        self.proteins = list(map(intern, arrays['proteins'].tolist()))
+        self.prot_index = {prot: i for i, prot in enumerate(self.proteins)}
+        self.edges = (arrays['src'], arrays['dst'])
+        self.__int_list, self.__int_dict = None, None
+        self.adjacency = (arrays['indptr'], arrays['indices'])
+        self.degrees = arrays['degrees']
+        self.cleaning_report = Counter(
+            {'duplicates': int(arrays['report'][0]), 'self-loops': int(arrays['report'][1])})
+        return True
+
+    def iter_interactions(self, chunk_size: int = 65536) -> Iterator[Tuple[str, str]]:
+        """Iterates over the interactions of the graph, from int_list if it exists,
+        else chunk by chunk from the edge arrays.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of edges converted to names at once, by default 65536
+
+        Yields
+        ------
+        Tuple[str, str]
+            The two proteins of an interaction
+        """
+        if self.__int_list is not None:
+            yield from self.__int_list
+            return
+        src, dst = self.edges
+        for start in range(0, len(src), chunk_size):
+            yield from zip(map(self.proteins.__getitem__, src[start:start+chunk_size].tolist()),
+                           map(self.proteins.__getitem__, dst[start:start+chunk_size].tolist()))
 
     def read_interaction_file(self) -> Tuple[list[Tuple[str, str]], dict[str, list[str]]]:
         """ Reads an interaction file and format the interactions in the form of a dictionary and a list.
@@ -286,6 +1187,36 @@ class Interactome:
                 dict_interactions.setdefault(key, []).append(value)
         return list_interactions, dict_interactions
 
+    def index_proteins(self) -> Tuple[list[str], dict[str, int]]:
+        """Lists the graph's vertices from the dictionary of interactions and gives each one an id.
+
+        Returns
+        -------
+        list[str], dict[str, int]
+            The sorted list of the graph's vertices (id to name) and the dictionary from name to id.
+        """
+        key = list(self.int_dict.keys())
+        value = list(self.int_dict.values())
+        nodes_list = sorted(set(key + list(chain(*value))))
+        return nodes_list, {prot: i for i, prot in enumerate(nodes_list)}
+
+    def read_interaction_file_csr(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Reads a dictionary of interactions and format the interactions in the form of a sparse matrix.
+        Vertices are numbered according to prot_index.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The CSR arrays (indptr, indices) of interactions.
+        """
+        index = self.prot_index
+        nb_edges: int = sum(len(v) for v in self.int_dict.values())
+        src = np.fromiter((index[key] for key, value in self.int_dict.items()
+                          for _ in value), dtype=np.int32, count=nb_edges)
+        dst = np.fromiter((index[item] for value in self.int_dict.values() for item in value),
+                          dtype=np.int32, count=nb_edges)
+        return build_csr(src, dst, len(self.proteins))
+
     def read_interaction_file_mat(self) -> Tuple[np.ndarray, list[str]]:
         """Reads a dictionary of interactions and format the interactions in the form of a matrix.
         The matrix size is equal to the number of dual interactions in the file.
@@ -295,19 +1226,21 @@ class Interactome:
         np.ndarray, list[str]
             The matrix of interactions and the list of the graph's vertices.
             The order of the vertices in the list is representative of the order in the matrix.
+            Neither is kept by the graph, which ids are left unchanged.
         """
-        key = list(self.int_dict.keys())
-        value = list(self.int_dict.values())
-        nodes_list = sorted(set(key + list(chain(*value))))
-        dim = len(nodes_list)
-        matrix = np.zeros([dim, dim], dtype=int)
-        for key2, value2 in self.int_dict.items():
-            col = nodes_list.index(key2)
-            for item in value2:
-                line = nodes_list.index(item)
-                matrix[line][col] = 1
-                matrix[col][line] = 1
-        return np.asarray(matrix), nodes_list
+        proteins, prot_index = self.index_proteins()
+        if len(proteins) > self.DENSE_LIMIT:
+            raise MemoryError(
+                f"Graph has {len(proteins)} nodes, dense matrix is only available up to {self.DENSE_LIMIT} nodes")
+        nb_edges: int = sum(len(v) for v in self.int_dict.values())
+        src = np.fromiter((prot_index[key] for key, value in self.int_dict.items()
+                          for _ in value), dtype=np.int64, count=nb_edges)
+        dst = np.fromiter((prot_index[item] for value in self.int_dict.values() for item in value),
+                          dtype=np.int64, count=nb_edges)
+        matrix = np.zeros([len(proteins), len(proteins)], dtype=int)
+        matrix[src, dst] = 1
+        matrix[dst, src] = 1
+        return matrix, proteins
 
     def count_vertices(self) -> int:
         """ Count the number of unique vertices.
@@ -327,7 +1260,295 @@ class Interactome:
         int
             Number of unique edges in the graph
         """
-        return len(self.int_list)
+        if self.__int_list is None:
+            return len(self.edges[0])
+        return len(self.__int_list)
+
+    def count_degrees(self) -> np.ndarray:
+        """Counts the number of interactions of every protein in a single pass over the edges.
+
+        Returns
+        -------
+        np.ndarray
+            The degree of each protein, aligned with proteins.
+        """
+        return np.bincount(np.concatenate(self.edges), minlength=len(self.proteins))
+
+    def __add_interactions(self, src: Iterable[int], dst: Iterable[int]) -> None:
+        """Adds new interactions between proteins given by their ids, and proteins appended to proteins since.
+        int_list and int_dict if built, edges, degrees and path labels are updated in place,
+        at a cost proportional to the number of interactions added. So are the neighbors kept aside from the adjacency.
+
+        Args:
+            src (Iterable[int]): first proteins, first in int_list and keys in int_dict
+            dst (Iterable[int]): proteins they connect to
+        """
+        src = np.asarray(src, dtype=np.int32)
+        dst = np.asarray(dst, dtype=np.int32)
+        # edges are read before int_list grows, as they may be built from it
+        nb_edges: int = len(self.edges[0])
+        if self.__int_list is not None or self.__int_dict is not None:
+            pairs: list[Tuple[str, str]] = list(zip(map(self.proteins.__getitem__, src.tolist()),
+                                                    map(self.proteins.__getitem__, dst.tolist())))
+            if self.__int_list is not None:
+                self.__int_list.extend(pairs)
+            if self.__int_dict is not None:
+                for prot_a, prot_b in pairs:
+                    self.__int_dict.setdefault(prot_a, []).append(prot_b)
+        self.__edges = tuple(reserve(ids, nb_edges+len(src))
+                             for ids in self.__edges)
+        self.__edges[0][nb_edges:nb_edges+len(src)] = src
+        self.__edges[1][nb_edges:nb_edges+len(dst)] = dst
+        self.__nb_edges = nb_edges+len(src)
+        if self.__positions is not None:
+            self.__positions.update(((a, b) if a < b else (b, a), i) for i, (a, b) in enumerate(
+                zip(src.tolist(), dst.tolist()), nb_edges))
+        self.__degrees = reserve(self.__degrees, len(self.proteins))
+        np.add.at(self.__degrees, src, 1)
+        np.add.at(self.__degrees, dst, 1)
+        self.__defer(src.tolist(), dst.tolist(), removal=False)
+        labels: np.ndarray | None = self.__memo.get('CC')
+        self.__memo = dict() if labels is None else {
+            'CC': self.__merge_CC(labels, src, dst)}
+
+    def __defer(self, src: list[int], dst: list[int], removal: bool) -> None:
+        """Keeps interactions added or removed aside from the adjacency, both ways, for neighbor queries to merge them in.
+        Past OVERFLOW_LIMIT changes or an eighth of the interactions, the adjacency is rebuilt on its next read instead.
+
+        Args:
+            src (list[int]): first proteins of the interactions
+            dst (list[int]): proteins they connect to
+            removal (bool): whether the interactions were removed rather than added
+        """
+        if self.__adjacency is None:
+            return
+        self.__pending += 2*len(src)
+        if self.__pending > max(self.OVERFLOW_LIMIT, self.__nb_edges//8):
+            self.__adjacency = None
+            return
+        kept, cancelled = (self.__removed, self.__added) if removal else (
+            self.__added, self.__removed)
+        for a, b in zip(src, dst):
+            for node, neighbor in ((a, b), (b, a)):
+                # an interaction removed then added again, or the reverse, is back in the adjacency as built
+                if neighbor in cancelled.get(node, ()):
+                    cancelled[node].discard(neighbor)
+                else:
+                    kept.setdefault(node, set()).add(neighbor)
+
+    def __merge_CC(self, labels: np.ndarray, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+        """Updates the labels of label_CC with new interactions and proteins, merging the paths they link.
+        Interactions within a path cost O(1) each, but adding proteins or merging paths
+        takes a pass over all labels, to extend or renumber them.
+
+        Args:
+            labels (np.ndarray): labels of the proteins before the change
+            src (np.ndarray): first proteins of the new interactions
+            dst (np.ndarray): proteins they connect to
+
+        Returns:
+            np.ndarray: labels of all proteins, numbered as label_CC would (read-only)
+        """
+        # each new protein starts its own path, after the existing ones
+        new: int = len(self.proteins) - len(labels)
+        if new:
+            count: int = int(labels.max(initial=0))
+            labels = np.concatenate(
+                [labels, np.arange(count+1, count+1+new, dtype=np.int32)])
+            labels.flags.writeable = False
+        # union-find over the labels touched by new interactions only
+        parent: dict[int, int] = dict()
+
+        def find(label: int) -> int:
+            while parent.get(label, label) != label:
+                parent[label] = parent.get(parent[label], parent[label])
+                label = parent[label]
+            return label
+
+        for label_a, label_b in zip(labels[src].tolist(), labels[dst].tolist()):
+            root_a, root_b = find(label_a), find(label_b)
+            # a merged path keeps the smallest label, the one of its first protein
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+        if parent:
+            count = int(labels.max(initial=0))
+            roots: np.ndarray = np.arange(count+1)
+            for label in list(parent):
+                roots[label] = find(label)
+            # remaining labels are renumbered without gaps, in the same order
+            rank: np.ndarray = np.cumsum(roots == np.arange(count+1)) - 1
+            labels = rank[roots][labels].astype(np.int32)
+            labels.flags.writeable = False
+        return labels
+
+    def __edge_positions(self) -> dict[Tuple[int, int], int]:
+        """Gets the position in edges of each interaction, built on first call then kept up to date
+
+        Returns:
+            dict[Tuple[int, int], int]: position of each interaction, given by the sorted ids of its proteins
+        """
+        if self.__positions is None:
+            src, dst = self.edges
+            self.__positions = {(a, b) if a < b else (b, a): i for i, (a, b) in enumerate(
+                zip(src.tolist(), dst.tolist()))}
+        return self.__positions
+
+    def add_node(self, prot: str) -> None:
+        """Adds a protein without interactions
+
+        Parameters
+        ----------
+        prot : str
+            The name of the new protein
+
+        Raises
+        ------
+        ValueError
+            If the protein already exists
+        """
+        if not isinstance(prot, str):
+            raise ValueError("Expecting a string")
+        if prot in self.prot_index:
+            raise ValueError("Protein already exists")
+        self.prot_index[prot] = len(self.proteins)
+        self.proteins.append(prot)
+        self.__add_interactions([], [])
+
+    def add_edge(self, prot_a: str, prot_b: str) -> bool:
+        """Adds an interaction, and its proteins if they do not exist yet.
+        Costs O(1) amortized, once the position of each interaction is indexed on the first call.
+
+        Parameters
+        ----------
+        prot_a : str
+            The first protein of the interaction
+        prot_b : str
+            The second protein of the interaction
+
+        Returns
+        -------
+        bool
+            False if the interaction already exists or is a self-loop, and was not added, else True
+        """
+        return self.add_edges([(prot_a, prot_b)]) == 1
+
+    def add_edges(self, interactions: Iterable[Tuple[str, str]]) -> int:
+        """Adds interactions, and their proteins if they do not exist yet. Interactions which
+        already exist and self-loops are skipped, as when cleaning an interactome file.
+
+        Parameters
+        ----------
+        interactions : Iterable[Tuple[str, str]]
+            The interactions to add
+
+        Returns
+        -------
+        int
+            The number of interactions added
+        """
+        positions: dict[Tuple[int, int], int] = self.__edge_positions()
+        added: set[Tuple[int, int]] = set()
+        src, dst = array('i'), array('i')
+        for prot_a, prot_b in interactions:
+            for prot in (prot_a, prot_b):
+                if not isinstance(prot, str):
+                    raise ValueError("Expecting a string")
+                if prot not in self.prot_index:
+                    self.prot_index[prot] = len(self.proteins)
+                    self.proteins.append(prot)
+            a, b = self.prot_index[prot_a], self.prot_index[prot_b]
+            key: Tuple[int, int] = (a, b) if a < b else (b, a)
+            if a != b and key not in positions and key not in added:
+                added.add(key)
+                src.append(a)
+                dst.append(b)
+        self.__add_interactions(src, dst)
+        return len(src)
+
+    def remove_edge(self, prot_a: str, prot_b: str) -> None:
+        """Removes an interaction in O(1) amortized, its proteins are kept.
+        The last interaction of int_list and edges takes the place of the removed one.
+
+        Parameters
+        ----------
+        prot_a : str
+            The first protein of the interaction
+        prot_b : str
+            The second protein of the interaction
+
+        Raises
+        ------
+        ValueError
+            If the interaction does not exist
+        """
+        a, b = self.__id(prot_a), self.__id(prot_b)
+        positions: dict[Tuple[int, int], int] = self.__edge_positions()
+        key: Tuple[int, int] = (a, b) if a < b else (b, a)
+        if key not in positions:
+            raise ValueError("Interaction does not exist")
+        i: int = positions.pop(key)
+        last: int = self.__nb_edges - 1
+        src, dst = (reserve(ids, self.__nb_edges) for ids in self.__edges)
+        if self.__int_dict is not None:
+            first, second = self.proteins[src[i]], self.proteins[dst[i]]
+            self.__int_dict[first].remove(second)
+            if not self.__int_dict[first]:
+                del self.__int_dict[first]
+        if i != last:
+            src[i], dst[i] = src[last], dst[last]
+            moved_a, moved_b = int(src[i]), int(dst[i])
+            positions[(moved_a, moved_b) if moved_a < moved_b
+                      else (moved_b, moved_a)] = i
+            if self.__int_list is not None:
+                self.__int_list[i] = self.__int_list[last]
+        if self.__int_list is not None:
+            self.__int_list.pop()
+        self.__edges, self.__nb_edges = (src, dst), last
+        self.__degrees = reserve(self.__degrees, len(self.proteins))
+        self.__degrees[[a, b]] -= 1
+        self.__defer([a], [b], removal=True)
+        labels: np.ndarray | None = self.__memo.get('CC')
+        self.__memo = dict() if labels is None else {
+            'CC': self.__split_CC(labels, a, b)}
+
+    def __split_CC(self, labels: np.ndarray, a: int, b: int) -> np.ndarray:
+        """Updates the labels of label_CC once the interaction between two proteins is removed.
+        Searches from both proteins take turns until they meet, or until one of them runs out of proteins:
+        the path is then split and the proteins found by that search are labeled apart.
+        The searches cost as much as the smaller piece, or the path between both proteins,
+        but a split takes a pass over all labels to renumber the paths after it.
+
+        Args:
+            labels (np.ndarray): labels of the proteins before the change
+            a (int): first protein of the removed interaction
+            b (int): second protein of the removed interaction
+
+        Returns:
+            np.ndarray: labels of all proteins, numbered as label_CC would (read-only)
+        """
+        visited: Tuple[set[int], set[int]] = ({a}, {b})
+        queues: Tuple[deque, deque] = (deque([a]), deque([b]))
+        side: int = 0
+        while queues[side]:
+            for node in self.__row(queues[side].popleft()).tolist():
+                if node in visited[1-side]:
+                    return labels
+                if node not in visited[side]:
+                    visited[side].add(node)
+                    queues[side].append(node)
+            side = 1-side
+        label: int = int(labels[a])
+        members: np.ndarray = np.flatnonzero(labels == label)
+        piece: np.ndarray = np.fromiter(visited[side], dtype=np.int64)
+        # the piece without the first protein of the path takes a new label, after the paths starting before it
+        if int(members[0]) in visited[side]:
+            piece = np.setdiff1d(members, piece)
+        first: int = int(piece.min())
+        new: int = int(labels[:first].max(initial=0)) + 1
+        labels = np.where(labels >= new, labels+1, labels).astype(np.int32)
+        labels[piece] = new
+        labels.flags.writeable = False
+        return labels
 
     def get_degree(self, prot: str) -> int:
         """Count the number of interactions for a specific protein.
@@ -342,11 +1563,7 @@ class Interactome:
         int
             The number of edges linked to a specific protein if the protein exists, else raise a ValueError.
         """
-        if prot in self.proteins:
-            degree = self.flat_list.count(prot)
-        else:
-            raise ValueError("Protein does not exist")
-        return degree
+        return int(self.degrees[self.__id(prot)])
 
     def get_max_degree(self) -> Tuple[int, list]:
         """Gets the protein with the highest number of interactions and the number of interactions associated.
@@ -356,10 +1573,9 @@ class Interactome:
         Tuple[int, list]
             The number of interaction max and the names of the proteins associated.
         """
-        list_degrees = [self.get_degree(prot) for prot in self.proteins]
-        max_degree = max(list_degrees)
-        prot_max_degree = [self.proteins[i] for i, degree in enumerate(
-            list_degrees) if degree == max_degree]
+        max_degree = int(self.degrees.max())
+        prot_max_degree = [self.proteins[i]
+                           for i in np.flatnonzero(self.degrees == max_degree)]
         return max_degree, prot_max_degree
 
     def get_ave_degree(self) -> float:
@@ -370,7 +1586,7 @@ class Interactome:
         float
             The average degree of PPI interactions
         """
-        return mean([self.get_degree(prot) for prot in self.proteins])
+        return float(self.degrees.mean())
 
     def count_degree(self, deg: int) -> int:
         """Counts the number of proteins with a given degree deg
@@ -385,8 +1601,7 @@ class Interactome:
         int
             The number of proteins in the graph with the given degree deg
         """
-        list_degrees = [self.get_degree(prot) for prot in self.proteins]
-        return len([self.proteins[i] for i, degree in enumerate(list_degrees) if degree == deg])
+        return int(np.count_nonzero(self.degrees == deg))
 
     def __output_histogram(self, data: Counter) -> None:
         """Plots histogram from counter
@@ -396,6 +1611,7 @@ class Interactome:
         data : Counter
             Number of number of edges to a node
         """
+        import matplotlib.pyplot as plt
         plt.bar(data.keys(), data.values())
         plt.xticks(np.arange(1, max(data.values())+1, 1))
         plt.show()
@@ -412,10 +1628,28 @@ class Interactome:
             upper boundary
 
         """
-        self.__output_histogram(Counter(self.get_degree(p) for p in self.proteins if self.get_degree(p) >= dmin and self.get_degree(p) <= dmax))
+        degrees = self.degrees[(self.degrees >= dmin) & (self.degrees <= dmax)]
+        self.__output_histogram(
+            Counter(dict(zip(*(x.tolist() for x in np.unique(degrees, return_counts=True))))))
+
+    def __id(self, prot: str) -> int:
+        """Gets the id of a protein
+
+        Args:
+            prot (str): protein to look for
+
+        Raises:
+            ValueError: happens if protein is not in the graph
 
-    def __neighbors(self, prot: str) -> list:
-        ''' Gets the neighbors of a protein 
+        Returns:
+            int: position of the protein in proteins
+        """
+        if prot not in self.prot_index:
+            raise ValueError("Protein does not exist")
+        return self.prot_index[prot]
+
+    def __neighbors(self, prot: str) -> np.ndarray:
+        ''' Gets the neighbors of a protein from the adjacency index
         Parameters
         ----------
         prot : str
@@ -423,11 +1657,32 @@ class Interactome:
 
         Returns
         -------
-        list
-            The list of neighbors of the protein
+        np.ndarray
+            The ids of the neighbors of the protein, sorted
         
         '''
-        return [a if b == prot else b for (a, b) in self.int_list if a == prot or b == prot]
+        return self.__row(self.__id(prot))
+
+    def __row(self, i: int) -> np.ndarray:
+        """Gets the neighbors of a protein from the adjacency, with the ones added or removed since merged in
+
+        Args:
+            i (int): id of the protein
+
+        Returns:
+            np.ndarray: ids of the neighbors of the protein, sorted
+        """
+        indptr, indices = self.adjacency if self.__adjacency is None else self.__adjacency
+        row: np.ndarray = indices[indptr[i]:indptr[i+1]
+                                  ] if i+1 < len(indptr) else indices[:0]
+        removed: set[int] | None = self.__removed.get(i)
+        added: set[int] | None = self.__added.get(i)
+        if removed:
+            row = row[~np.isin(row, list(removed))]
+        if added:
+            row = np.sort(np.concatenate(
+                [row, np.fromiter(added, dtype=row.dtype, count=len(added))]))
+        return row
 
     def __clique(self, prot: str) -> int:
         """Get neighbors of prot
@@ -466,40 +1721,101 @@ class Interactome:
         """
         if self.get_degree(prot) <= 1:
             return 0
-        number_neighbors_interactions: int = len(
-            [0 for x in self.int_list if x in list(
-                permutations(self.__neighbors(prot), r=2))]
-        )
+        neighbors: set[int] = set(self.__neighbors(prot).tolist())
+        # each interaction between two neighbors is seen from both of them
+        number_neighbors_interactions: int = sum(len(neighbors.intersection(
+            self.__row(node).tolist())) for node in neighbors)//2
         return number_neighbors_interactions/self.__clique(prot)
 
-    def __generate_protein(self, length: int = 5) -> str:
-        ''' Generates random 5 letters strings to serve as nodes
-        
+    def clustering_all(self) -> Tuple[np.ndarray, float, float]:
+        """Computes the clustering coefficient of every node in a single pass over the edges,
+        counting triangles by intersecting the neighborhoods of both ends of each edge.
+        Results are computed once, until interactions are changed.
+
         Returns
         -------
-        str
-            The 5 letters string
-        '''
-        while True:
-            prot_name: str = ''.join(choice(ascii_uppercase)
-                                     for i in range(length))
-            if prot_name not in self.proteins:
-                break
-        self.proteins = self.proteins + [prot_name]
-        return prot_name
-
-    def __save_graph(self, graph: list) -> None:
-        """Saves a graph from a list
-
-        Args:
-            graph (list): _description_
+        np.ndarray, float, float
+            The clustering coefficient of each protein (aligned with proteins, 0 if it has less than two neighbors),
+            the transitivity of the graph and its average clustering coefficient
         """
-        with open(".temp_graph.txt", 'w') as handler:
-            handler.write('\n'.join(
-                [str(len(graph))]+[f"{key} {value}" for (key, value) in graph]))
+        if 'clustering' not in self.__memo:
+            indptr, indices = self.adjacency
+            neighbors: list[set[int]] = [set(indices[indptr[i]:indptr[i+1]].tolist())
+                                         for i in range(len(indptr)-1)]
+            rows: np.ndarray = np.repeat(
+                np.arange(len(indptr)-1), np.diff(indptr))
+            # each edge once, from its smallest end
+            mask: np.ndarray = rows < indices
+            src, dst = rows[mask], indices[mask]
+            shared: np.ndarray = np.fromiter((len(neighbors[a] & neighbors[b]) for a, b in zip(src.tolist(), dst.tolist())),
+                                             dtype=np.int64, count=len(src))
+            # each triangle of a node is seen from its two edges to the node
+            triangles: np.ndarray = (np.bincount(src, weights=shared, minlength=len(neighbors)) +
+                                     np.bincount(dst, weights=shared, minlength=len(neighbors)))
+            degrees: np.ndarray = np.diff(indptr)
+            pairs: np.ndarray = degrees * (degrees-1)
+            coefficients: np.ndarray = np.divide(
+                triangles, pairs, out=np.zeros(len(neighbors)), where=pairs > 0)
+            coefficients.flags.writeable = False
+            transitivity: float = float(
+                triangles.sum()/pairs.sum()) if pairs.sum() else 0.0
+            average: float = float(
+                coefficients.mean()) if len(coefficients) else 0.0
+            self.__memo['clustering'] = (coefficients, transitivity, average)
+        return self.__memo['clustering']
+
+    def __generate_proteins(self, k: int, length: int = 5, rng: Random | None = None, prefix: str | None = None) -> list[str]:
+        ''' Reserves k new unique names to serve as nodes, appended to proteins and prot_index as isolated proteins.
+        Names are random 5 letters strings, drawn by batches and checked against prot_index,
+        or the prefix followed by a counter if a prefix is given.
+
+        Parameters
+        ----------
+        k : int
+            The number of names to reserve
+        length : int, optional
+            The number of letters of random names, by default 5
+        rng : Random, optional
+            The random generator to draw letters from, by default the one of the random module
+        prefix : str, optional
+            If given, names are deterministic, made of the prefix and a counter, by default None
 
-    def erdos_renyi_graph(self, n: int, q: float, oriented=False):
+        Returns
+        -------
+        list[str]
+            The k new names, in the order of their ids
+        '''
+        names: dict[str, None] = dict()
+        if prefix is not None:
+            counter: int = len(self.proteins)
+            while len(names) < k:
+                batch: list[str] = [
+                    f"{prefix}{i}" for i in range(counter, counter+k-len(names))]
+                counter += len(batch)
+                names.update((name, None)
+                             for name in batch if name not in self.prot_index)
+        else:
+            if len(ascii_uppercase)**length - len(self.prot_index) < k:
+                raise ValueError(
+                    f"Not enough {length} letters names left for {k} proteins")
+            while len(names) < k:
+                missing: int = k-len(names)
+                letters: str = ''.join((rng or random).choices(
+                    ascii_uppercase, k=length*missing))
+                names.update((name, None) for name in (letters[i:i+length] for i in range(0, len(letters), length))
+                             if name not in self.prot_index)
+        new_names: list[str] = list(names)[:k]
+        self.prot_index.update(
+            (name, i) for i, name in enumerate(new_names, len(self.proteins)))
+        self.proteins.extend(new_names)
+        # new proteins start their own paths, as with add_node
+        self.__add_interactions([], [])
+        return new_names
+
+    def erdos_renyi_graph(self, n: int, q: float, oriented=False, seed: int | None = None, prefix: str | None = None):
         """Creates a random graph with n nodes and generate edges randomly between each set of nodes, with respect to the probability q.
+        Pairs of nodes are numbered, and the gaps between two kept pairs are drawn from a geometric law,
+        so that only kept edges are ever generated.
 
         Parameters
         ----------
@@ -509,80 +1825,138 @@ class Interactome:
             The probability for the edges' creation
         oriented : bool, optional
             True if the graph is oriented, else False (default)
+        seed : int, optional
+            Seed of the random generators, by default None
+        prefix : str, optional
+            Names proteins with this prefix and a counter instead of random letters, by default None
         Returns
         -------
         List
             the erdos renyi graph
         """
-        nodes = [self.__generate_protein() for i in range(1, n+1)]
-        list_all_edges = list((combinations(nodes, 2)))
-        proba_array = [choices([0, 1], weights=[1-q, q])[0]
-                       for _ in range(len(list_all_edges))]
+        nodes, w, v = self.__erdos_renyi(n, q, seed, prefix)
+        return list(zip(map(nodes.__getitem__, w.tolist()), map(nodes.__getitem__, v.tolist())))
 
-        graph = [edge for i, edge in enumerate(
-            list_all_edges) if proba_array[i]]
-        return graph
+    def __erdos_renyi(self, n: int, q: float, seed: int | None = None, prefix: str | None = None) -> Tuple[list[str], np.ndarray, np.ndarray]:
+        """Draws the nodes and edges of erdos_renyi_graph, edges being given by the positions of their nodes
+
+        Parameters
+        ----------
+        n : int
+            The number of nodes
+        q : float
+            The probability for the edges' creation
+        seed : int, optional
+            Seed of the random generators, by default None
+        prefix : str, optional
+            Names proteins with this prefix and a counter instead of random letters, by default None
+
+        Returns
+        -------
+        Tuple[list[str], np.ndarray, np.ndarray]
+            The names of the new nodes, and both ends of each edge as positions in these names
+        """
+        rng = np.random.default_rng(seed)
+        name_rng = Random(seed)
+        nodes = self.__generate_proteins(n, rng=name_rng, prefix=prefix)
+        nb_pairs: int = n*(n-1)//2
+        if q <= 0 or nb_pairs == 0:
+            return nodes, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        # pair k is (w, v) with w < v and k = v(v-1)/2 + w
+        kept: list[np.ndarray] = []
+        last: int = -1
+        while last < nb_pairs:
+            batch: int = int(1.1*q*(nb_pairs-last)) + 64
+            positions = last + np.cumsum(rng.geometric(q, size=batch))
+            kept.append(positions[positions < nb_pairs])
+            last = int(positions[-1])
+        pairs: np.ndarray = np.concatenate(kept)
+        v: np.ndarray = ((1 + np.sqrt(1 + 8*pairs.astype(np.float64)))//2).astype(np.int64)
+        # rounding errors of the square root for large k
+        v -= v*(v-1)//2 > pairs
+        v += v*(v+1)//2 <= pairs
+        w: np.ndarray = pairs - v*(v-1)//2
+        return nodes, w, v
     
-    def barabasi_albert_graph(self, m: int) -> None:
+    def __preferential_attachment(self, nodes: list[int], edges_per_node: int, rng: Random) -> None:
+        """Connects new nodes one after the other to existing nodes chosen proportionally to their degree.
+        An urn holds both ends of every edge, so that drawing uniformly from it is drawing proportionally
+        to degrees, and each target is drawn in O(1).
+
+        Args:
+            nodes (list[int]): ids of the new nodes, in increasing order and greater than the ids of existing nodes
+            edges_per_node (int): number of distinct nodes each new node connects to
+            rng (Random): random generator to draw targets from
+        """
+        src, dst = self.edges
+        urn: array = array('i', np.concatenate([src, dst]).tolist())
+        connected: int = int(np.count_nonzero(self.degrees))
+        new_src, new_dst = array('i'), array('i')
+        for node in nodes:
+            # without any edge yet, targets are drawn uniformly among existing nodes
+            wanted: int = min(edges_per_node, connected if urn else node)
+            targets: list[int] = []
+            while len(targets) < wanted:
+                target: int = urn[int(rng.random()*len(urn))
+                                  ] if urn else int(rng.random()*node)
+                if target not in targets:
+                    targets.append(target)
+            if not urn:
+                connected += len(targets)
+            if targets:
+                connected += 1
+            for target in targets:
+                urn.append(target)
+                urn.append(node)
+                new_src.append(node)
+                new_dst.append(target)
+        self.__add_interactions(new_src, new_dst)
+
+    def barabasi_albert_graph(self, m: int, edges_per_node: int = 1, seed: int | None = None, prefix: str | None = None) -> None:
         """Creates a random graph according to the Barabasi Albert model, starts from the Interactome graph and updates it.
 
         Parameters
         ----------
         m : int
             The number of nodes to add, following the Barabasi-Albert algorithm
+        edges_per_node : int, optional
+            The number of existing nodes each new node connects to, by default 1
+        seed : int, optional
+            Seed of the random generator, by default None
+        prefix : str, optional
+            Names proteins with this prefix and a counter instead of random letters, by default None
         """
-        for node in [self.__generate_protein() for _ in range(m)]:
-            self.int_dict[node] = []
-            connected_node: bool = False
-            while not connected_node:
-                for key in set(list(chain(*self.int_list))):
-                    if key != node:
-                        probability = (self.get_degree(key)) / \
-                            (2*self.count_edges())
-                        if choices([0, 1], weights=[1-probability, probability])[0]:
-                            self.int_list.append((node, key))
-                            if key in self.int_dict.keys():
-                                self.int_dict[key].append(node)
-                            else:
-                                self.int_dict[key] = [node]
-                            connected_node = True
-        self.int_mat, self.proteins = self.read_interaction_file_mat()
-        
-        
+        rng = Random(seed)
+        nodes = [self.prot_index[prot]
+                 for prot in self.__generate_proteins(m, rng=rng, prefix=prefix)]
+        self.__preferential_attachment(nodes, edges_per_node, rng)
 
-    def __barabasi_albert(self, m: int) -> None:
+    def __barabasi_albert(self, m: int, edges_per_node: int = 1, seed: int | None = None, prefix: str | None = None) -> None:
         """Creates a random graph according to the Barabasi Albert model, starting from an empty graph.
 
         Parameters
         ----------
         m : int
             The number of nodes to add, following the Barabasi-Albert algorithm
-
-        Returns
-        -------
-        list[Tuple[str, str]]
-            The new graph containing all the new nodes, linked to the original nodes according to the Barabasi algorithm
+        edges_per_node : int, optional
+            The number of existing nodes each new node connects to, by default 1
+        seed : int, optional
+            Seed of the random generator, by default None
+        prefix : str, optional
+            Names proteins with this prefix and a counter instead of random letters, by default None
+
+        Raises
+        ------
+        ValueError
+            If m is less than 2, as the graph starts from an interaction between the first two nodes
         """
-        nodes = [self.__generate_protein() for _ in range(m)]
-        self.int_dict[nodes[0]] = [nodes[1]]
-        self.int_list = [(nodes[0], nodes[1])]
-
-        for node in nodes[2:]:
-            self.int_dict[node] = []
-            connected_node: bool = False
-            while not connected_node:
-                for key in set(list(chain(*self.int_list))):
-                    if key != node:
-                        probability = (self.get_degree(key)) / (2*self.count_edges())
-                        if choices([0, 1], weights=[1-probability, probability])[0] or self.int_list == []:
-                            self.int_list.append((node, key))
-                            if key in self.int_dict.keys():
-                                self.int_dict[key].append(node)
-                            else:
-                                self.int_dict[key] = [node]
-                            connected_node = True
-        return self.int_list
-
+        if m < 2:
+            raise ValueError("Expecting at least 2 nodes")
+        rng = Random(seed)
+        nodes = [self.prot_index[prot]
+                 for prot in self.__generate_proteins(m, rng=rng, prefix=prefix)]
+        self.__add_interactions(nodes[:1], nodes[1:2])
+        self.__preferential_attachment(nodes[2:], edges_per_node, rng)
 
     def extract_all_CC(self) -> dict:
         """ Extracts all the paths from a graph
@@ -592,16 +1966,57 @@ class Interactome:
         dict
             A dictionnary where the key is the path's number, and the value is the list of nodes belonging to the path.
         """
-        nodes_left = self.proteins
-        CC_dict = dict()
-        i = 1
-        while nodes_left:
-            prot = nodes_left[0]
-            CC_dict[i] = self.extract_CC(prot)
-            nodes_left = list(
-                filter(lambda x: x not in CC_dict[i], nodes_left))
-            i += 1
-        return CC_dict
+        labels: np.ndarray = self.label_CC()
+        if not len(labels):
+            return dict()
+        order: np.ndarray = np.argsort(labels, kind='stable')
+        bounds: np.ndarray = np.cumsum(np.bincount(labels)[1:])[:-1]
+        return {i: [self.proteins[j] for j in ids.tolist()] for i, ids in enumerate(np.split(order, bounds), 1)}
+
+    def label_CC(self) -> np.ndarray:
+        """ Labels the path of every protein, with union-find over the edges in a single pass.
+        Paths are numbered from 1, in the order of their first protein in proteins.
+        Labels are computed once, until interactions are changed.
+
+        Returns
+        -------
+        np.ndarray
+            The path's label of each protein, aligned with proteins (read-only)
+        """
+        if 'CC' not in self.__memo:
+            self.__memo['CC'] = self.__label_CC()
+        return self.__memo['CC']
+
+    def __label_CC(self) -> np.ndarray:
+        """ Computes the labels returned by label_CC
+
+        Returns
+        -------
+        np.ndarray
+            The path's label of each protein, aligned with proteins
+        """
+        parent: list[int] = list(range(self.count_vertices()))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        src, dst = self.edges
+        for node_a, node_b in zip(src.tolist(), dst.tolist()):
+            root_a, root_b = find(node_a), find(node_b)
+            # the root of a path is always its first protein
+            if root_a < root_b:
+                parent[root_b] = root_a
+            elif root_b < root_a:
+                parent[root_a] = root_b
+        roots = np.fromiter((find(node) for node in range(len(parent))),
+                            dtype=np.int64, count=len(parent))
+        labels: np.ndarray = (np.unique(
+            roots, return_inverse=True)[1] + 1).astype(np.int32)
+        labels.flags.writeable = False
+        return labels
 
     def extract_CC(self, prot: str, path: list = list()) -> list:
         """Identifies all the nodes contained in the same path as the protein given in argument
@@ -617,15 +2032,26 @@ class Interactome:
         list
             A list that contains the path including the protein
         """
+        start: int = self.__id(prot)
         path = path+[prot]
-        if self.get_degree(prot) >= 1:
-            for node in self.get_neighbors(prot):
-                if node not in path:
-                    path = self.extract_CC(node, path)
+        visited: set[int] = {self.__id(node) for node in path}
+        # depth-first search, with a stack of neighbor iterators in place of recursion
+        stack: list[Iterator[int]] = [
+            iter(self.__row(start).tolist())]
+        while stack:
+            for node in stack[-1]:
+                if node not in visited:
+                    visited.add(node)
+                    path.append(self.proteins[node])
+                    stack.append(
+                        iter(self.__row(node).tolist()))
+                    break
+            else:
+                stack.pop()
         return path
 
     def get_neighbors(self, prot: str) -> list:
-        """ Extracts the list of neighbors of a given protein from an interaction matrix
+        """ Extracts the list of neighbors of a given protein from the sparse adjacency
 
         Parameters
         ----------
@@ -637,12 +2063,341 @@ class Interactome:
         list
             The list of the protein's neighbors
         """
-        list_nodes_CC = []
-        prot_index_in_matrix = self.int_mat[self.proteins.index(prot)]
-        for i in range(len(self.proteins)):
-            if prot_index_in_matrix[i] == 1:
-                list_nodes_CC.append(self.proteins[i])
-        return list_nodes_CC
+        return [self.proteins[i] for i in self.__neighbors(prot).tolist()]
+
+    def neighbors_many(self, prots: Iterable[str]) -> dict[str, list[str]]:
+        """ Extracts the lists of neighbors of many proteins at once from the sparse adjacency
+
+        Parameters
+        ----------
+        prots : Iterable[str]
+            The given proteins
+
+        Returns
+        -------
+        dict[str, list[str]]
+            The list of neighbors of each given protein
+        """
+        prots = list(prots)
+        indptr, indices = self.adjacency if self.__adjacency is None else self.__adjacency
+        ids: np.ndarray = np.fromiter(
+            (self.__id(prot) for prot in prots), dtype=np.int64, count=len(prots))
+        # proteins with neighbors added or removed since the adjacency was built are merged one by one,
+        # the others are gathered at once without compacting the adjacency
+        merged: set[int] = {i for i in ids.tolist() if i in self.__added or i in self.__removed
+                            or i+1 >= len(indptr)}
+        gathered: np.ndarray = ids[~np.isin(ids, list(merged))] if merged else ids
+        neighbors: list[str] = [self.proteins[i]
+                                for i in gather_neighbors(indptr, indices, gathered)[0].tolist()]
+        bounds: list[int] = np.cumsum(
+            indptr[gathered+1] - indptr[gathered]).tolist()
+        found: dict[int, list[str]] = {i: neighbors[start:end] for i, start, end in zip(
+            gathered.tolist(), [0]+bounds, bounds)}
+        found.update((i, [self.proteins[j] for j in self.__row(i).tolist()])
+                     for i in merged)
+        return {prot: found[i] for prot, i in zip(prots, ids.tolist())}
+
+    def distances(self, prot: str) -> np.ndarray:
+        """ Computes the distance from a protein to every protein, by breadth-first search over the adjacency
+
+        Parameters
+        ----------
+        prot : str
+            The source protein
+
+        Returns
+        -------
+        np.ndarray
+            The number of interactions between prot and each protein, aligned with proteins, -1 if out of its path
+        """
+        return bfs_distances(*self.adjacency, [self.__id(prot)])[0]
+
+    def distances_many(self, prots: Iterable[str], processes: int | None = 1, chunk_size: int = 64) -> np.ndarray:
+        """ Computes the distances from many proteins to every protein, optionally in a pool of processes
+
+        Parameters
+        ----------
+        prots : Iterable[str]
+            The source proteins
+        processes : int | None, optional
+            Number of worker processes, None for the number of CPUs, by default 1 to search in this process
+        chunk_size : int, optional
+            Number of sources searched by a worker at once, by default 64
+
+        Returns
+        -------
+        np.ndarray
+            One row per source protein, as returned by distances
+        """
+        sources: list[int] = [self.__id(prot) for prot in prots]
+        return np.concatenate(self.__map_sources(bfs_distances, sources, processes, chunk_size) or [np.zeros((0, self.count_vertices()), dtype=np.int32)])
+
+    def __map_sources(self, worker: Callable, sources: list[int], processes: int | None, chunk_size: int) -> list:
+        """ Applies a search from many sources over the adjacency, by chunks of sources, optionally in a pool of processes
+
+        Parameters
+        ----------
+        worker : Callable
+            Module level function called with indptr, indices and a chunk of sources
+        sources : list[int]
+            The ids of the sources
+        processes : int | None
+            Number of worker processes, None for the number of CPUs, 1 to search in this process
+        chunk_size : int
+            Number of sources given to the worker at once
+
+        Returns
+        -------
+        list
+            The result of the worker for each chunk, in order
+        """
+        indptr, indices = (np.asarray(array) for array in self.adjacency)
+        chunks: list[list[int]] = [sources[start:start+chunk_size]
+                                   for start in range(0, len(sources), chunk_size)]
+        if processes == 1 or len(chunks) <= 1:
+            return [worker(indptr, indices, chunk) for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(worker, [indptr]*len(chunks), [indices]*len(chunks), chunks))
+
+    def shortest_path(self, prot_a: str, prot_b: str) -> list[str]:
+        """ Finds a shortest path between two proteins, by breadth-first searches from both ends,
+        always expanding the smallest frontier
+
+        Parameters
+        ----------
+        prot_a : str
+            The first protein of the path
+        prot_b : str
+            The last protein of the path
+
+        Returns
+        -------
+        list[str]
+            The proteins of the path from prot_a to prot_b, empty if they are not in the same path
+        """
+        indptr, indices = self.adjacency
+        ends: list[int] = [self.__id(prot_a), self.__id(prot_b)]
+        # for each side, the protein each visited protein was reached from and its distance to the end
+        parents: list[np.ndarray] = [
+            np.full(self.count_vertices(), -1, dtype=np.int64) for _ in ends]
+        depths: list[np.ndarray] = [
+            np.full(self.count_vertices(), -1, dtype=np.int32) for _ in ends]
+        frontiers: list[np.ndarray] = [np.array([end]) for end in ends]
+        for side, end in enumerate(ends):
+            parents[side][end], depths[side][end] = end, 0
+        meeting: int = ends[0] if ends[0] == ends[1] else -1
+        while meeting < 0 and all(len(frontier) for frontier in frontiers):
+            side: int = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            neighbors, owners = gather_neighbors(
+                indptr, indices, frontiers[side])
+            new: np.ndarray = parents[side][neighbors] < 0
+            frontier, first = np.unique(neighbors[new], return_index=True)
+            parents[side][frontier] = owners[new][first]
+            depths[side][frontier] = depths[side][frontiers[side][0]] + 1
+            frontiers[side] = frontier
+            # among proteins reached from both sides, the one closest to the other end
+            met: np.ndarray = frontier[depths[1-side][frontier] >= 0]
+            if len(met):
+                meeting = int(met[np.argmin(depths[1-side][met])])
+        if meeting < 0:
+            return []
+        halves: list[list[int]] = []
+        for side in (0, 1):
+            half: list[int] = [meeting]
+            while half[-1] != ends[side]:
+                half.append(int(parents[side][half[-1]]))
+            halves.append(half)
+        return [self.proteins[i] for i in halves[0][::-1] + halves[1][1:]]
+
+    def distance_statistics(self, exact_limit: int = 2000, samples: int = 256, processes: int | None = 1, chunk_size: int = 64, seed: int | None = None) -> dict[int, dict]:
+        """ Computes the diameter, the average shortest path length and the eccentricities of each path.
+        Paths of at most exact_limit proteins are searched from all their proteins and values are exact.
+        Larger paths are searched from samples random proteins : the average is estimated with a 95% error margin,
+        and eccentricities and diameter are bounded with the triangle inequality.
+
+        Parameters
+        ----------
+        exact_limit : int, optional
+            Size above which a path is sampled, by default 2000
+        samples : int, optional
+            Number of sources searched in a sampled path, by default 256
+        processes : int | None, optional
+            Number of worker processes, None for the number of CPUs, by default 1 to search in this process
+        chunk_size : int, optional
+            Number of sources searched by a worker at once, by default 64
+        seed : int | None, optional
+            Seed of the sampling of sources, by default None
+
+        Returns
+        -------
+        dict[int, dict]
+            For each path label, its 'size', the number of 'sources' searched, 'exact' if all proteins were,
+            the 'diameter' and the 'eccentricity' of its proteins (ordered as in extract_all_CC) as (lower, upper) bounds,
+            and its 'average' shortest path length with its 'error' margin
+        """
+        rng = np.random.default_rng(seed)
+        labels: np.ndarray = self.label_CC()
+        # proteins are renumbered path by path, so that each path is a block of the adjacency
+        order: np.ndarray = np.argsort(labels, kind='stable')
+        rank: np.ndarray = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order), dtype=np.int32)
+        indptr, indices = build_csr(
+            *(rank[ids] for ids in self.edges), len(order))
+        bounds: list[int] = np.cumsum(
+            np.bincount(labels, minlength=1)[1:]).tolist()
+        tasks: list[Tuple[int, np.ndarray, np.ndarray, np.ndarray]] = []
+        sources: dict[int, np.ndarray] = dict()
+        for label, start, end in zip(range(1, len(bounds)+1), [0]+bounds, bounds):
+            size: int = end-start
+            sources[label] = np.arange(size) if size <= exact_limit else np.sort(
+                rng.choice(size, min(samples, size), replace=False))
+            block: Tuple[np.ndarray, np.ndarray] = (indptr[start:end+1] - indptr[start],
+                                                     indices[indptr[start]:indptr[end]] - start)
+            tasks.extend((label, *block, sources[label][i:i+chunk_size])
+                         for i in range(0, len(sources[label]), chunk_size))
+        if processes == 1:
+            summaries = [bfs_summary(*task[1:]) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                summaries = list(
+                    pool.map(bfs_summary, *zip(*[task[1:] for task in tasks])))
+
+        parts: dict[int, list] = dict()
+        for task, summary in zip(tasks, summaries):
+            parts.setdefault(task[0], []).append(summary)
+        statistics: dict[int, dict] = dict()
+        for label, start, end in zip(range(1, len(bounds)+1), [0]+bounds, bounds):
+            eccentricities, sums = (np.concatenate(
+                [part[i] for part in parts[label]]) for i in (0, 1))
+            lower: np.ndarray = np.max([part[2] for part in parts[label]], axis=0)
+            upper: np.ndarray = np.min([part[3] for part in parts[label]], axis=0)
+            size, nb_sources = end-start, len(eccentricities)
+            # mean distance from each source to the other proteins of its path
+            means: np.ndarray = sums / max(size-1, 1)
+            error: float = 0.0
+            if 1 < nb_sources < size:
+                error = float(1.96 * means.std(ddof=1) / np.sqrt(nb_sources)
+                              * np.sqrt((size-nb_sources)/(size-1)))
+            statistics[label] = {'size': size, 'sources': nb_sources, 'exact': nb_sources == size,
+                                 'diameter': (int(lower.max()), int(min(upper.max(), 2*eccentricities.min()))),
+                                 'eccentricity': (lower, upper),
+                                 'average': float(means.mean()), 'error': error}
+        return statistics
+
+    def degree_centrality(self) -> np.ndarray:
+        """ Computes the degree of each protein divided by its largest possible degree
+
+        Returns
+        -------
+        np.ndarray
+            The degree centrality of each protein, aligned with proteins
+        """
+        return self.degrees / max(self.count_vertices()-1, 1)
+
+    def pagerank(self, alpha: float = 0.85, max_iter: int = 100, tol: float = 1e-06) -> np.ndarray:
+        """ Computes the PageRank of each protein by power iteration over the sparse adjacency.
+        The rank of proteins without interactions is spread evenly over all proteins.
+
+        Parameters
+        ----------
+        alpha : float, optional
+            Probability to follow an interaction rather than jump to any protein, by default 0.85
+        max_iter : int, optional
+            Maximal number of iterations, by default 100
+        tol : float, optional
+            Stops once ranks change by less than tol per protein, by default 1e-06
+
+        Returns
+        -------
+        np.ndarray
+            The PageRank of each protein, aligned with proteins, summing to 1
+
+        Raises
+        ------
+        ArithmeticError
+            If ranks did not converge within max_iter iterations
+        """
+        size: int = self.count_vertices()
+        if not size:
+            return np.zeros(0)
+        indptr, indices = self.adjacency
+        degrees: np.ndarray = np.diff(indptr)
+        isolated: np.ndarray = degrees == 0
+        ranks: np.ndarray = np.full(size, 1/size)
+        for _ in range(max_iter):
+            # each protein gives its rank evenly to its neighbors
+            shares: np.ndarray = np.repeat(
+                ranks / np.maximum(degrees, 1), degrees)
+            new_ranks: np.ndarray = alpha * np.bincount(indices, shares, size) + \
+                (1 - alpha + alpha * ranks[isolated].sum()) / size
+            if np.abs(new_ranks - ranks).sum() < size * tol:
+                return new_ranks
+            ranks = new_ranks
+        raise ArithmeticError(
+            f"PageRank did not converge in {max_iter} iterations")
+
+    def closeness(self, processes: int | None = 1, chunk_size: int = 64) -> np.ndarray:
+        """ Computes the closeness of each protein, from a breadth-first search from every protein.
+        Closeness is the inverse of the average distance to the reachable proteins,
+        weighted by the share of proteins reachable, so that it compares across paths.
+
+        Parameters
+        ----------
+        processes : int | None, optional
+            Number of worker processes, None for the number of CPUs, by default 1 to search in this process
+        chunk_size : int, optional
+            Number of sources searched by a worker at once, by default 64
+
+        Returns
+        -------
+        np.ndarray
+            The closeness of each protein, aligned with proteins, 0 for proteins without interactions
+        """
+        size: int = self.count_vertices()
+        if size < 2:
+            return np.zeros(size)
+        parts = self.__map_sources(
+            bfs_closeness, list(range(size)), processes, chunk_size)
+        sums, reached = (np.concatenate([part[i] for part in parts])
+                         for i in (0, 1))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            closeness: np.ndarray = (reached-1) / sums * (reached-1) / (size-1)
+        return np.where(sums > 0, closeness, 0.0)
+
+    def betweenness(self, k: int | None = None, normalized: bool = True, processes: int | None = 1, chunk_size: int = 64, seed: int | None = None) -> np.ndarray:
+        """ Computes the betweenness of each protein with Brandes' algorithm, from every protein
+        or from a random sample of k proteins whose dependencies are scaled up to estimate it
+
+        Parameters
+        ----------
+        k : int | None, optional
+            Number of sampled sources, by default None to use all proteins
+        normalized : bool, optional
+            Divides by the number of pairs of other proteins, by default True
+        processes : int | None, optional
+            Number of worker processes, None for the number of CPUs, by default 1 to search in this process
+        chunk_size : int, optional
+            Number of sources searched by a worker at once, by default 64
+        seed : int | None, optional
+            Seed of the sampling of sources, by default None
+
+        Returns
+        -------
+        np.ndarray
+            The betweenness of each protein, aligned with proteins
+        """
+        size: int = self.count_vertices()
+        sources: list[int] = list(range(size)) if k is None else np.sort(
+            np.random.default_rng(seed).choice(size, k, replace=False)).tolist()
+        betweenness: np.ndarray = np.sum(self.__map_sources(
+            brandes_dependencies, sources, processes, chunk_size), axis=0) if sources else np.zeros(size)
+        # each pair is counted from both of its ends
+        scale: float = 0.5
+        if normalized:
+            scale = 1 / ((size-1) * (size-2)) if size > 2 else 1.0
+        if k is not None and k:
+            scale *= size / k
+        return betweenness * scale
 
     def count_CC(self) -> Tuple[int, list[int, int]]:
         """Calculates the size of each path and the total number of paths in a graph
@@ -657,10 +2412,8 @@ class Interactome:
         list[int,int] :
             A list containing a tuple for each path. Each tuple contains the label and the size of a path
         """
-        dico = self.extract_all_CC()
-        count_CC = max(dico.keys())
-        list_size_CC = [(key, len(value)) for key, value in dico.items()]
-        return count_CC, list_size_CC
+        sizes: np.ndarray = np.bincount(self.label_CC())[1:]
+        return len(sizes), list(enumerate(sizes.tolist(), 1))
 
     def write_CC(self, CC_file_out="CC_file_out.txt") -> None:
         """ Writes in an output file the size and the nodes contained in each path of the graph. 
@@ -684,5 +2437,116 @@ class Interactome:
         list[int, str]
             A list containing tuples. Each tuple contains the path's label and the name of the protein belonging to this path
         """
-        dico = self.extract_all_CC()
-        return list(chain(*[[(key, i) for i in value] for key, value in dico.items()]))
\ No newline at end of file
+        labels: np.ndarray = self.label_CC()
+        return [(int(labels[i]), self.proteins[i]) for i in np.argsort(labels, kind='stable').tolist()]
+
+
+# statistics which can be computed on each interactome of a batch, see batch_statistics
+STATISTICS: dict[str, Callable[[Interactome], object]] = {
+    'vertices': Interactome.count_vertices,
+    'edges': Interactome.count_edges,
+    'max_degree': lambda graph: int(graph.degrees.max(initial=0)),
+    'average_degree': lambda graph: graph.get_ave_degree() if graph.count_vertices() else 0.0,
+    'density': lambda graph: graph.density() if graph.count_vertices() > 1 else 0.0,
+    'components': lambda graph: graph.count_CC()[0],
+    'largest_component': lambda graph: int(np.bincount(graph.label_CC()).max(initial=0)) if graph.count_vertices() else 0,
+}
+
+
+def interaction_files(pattern: str) -> list[str]:
+    """Lists the interactome files of a folder or matching a glob pattern
+
+    Args:
+        pattern (str): a folder, or a glob pattern such as 'species/*.txt'
+
+    Returns:
+        list[str]: sorted paths to the files
+    """
+    if path.isdir(pattern):
+        pattern = path.join(pattern, '*')
+    return sorted(filename for filename in glob(pattern) if path.isfile(filename))
+
+
+def interactome_statistics(filename: str, statistics: Iterable[str] = tuple(STATISTICS), method: str = 'default') -> dict:
+    """Loads an interactome file and computes some of its statistics
+
+    Args:
+        filename (str): path to an interactome file
+        statistics (Iterable[str], optional): names of the statistics, keys of STATISTICS. Defaults to all of them.
+        method (str, optional): loading method of the file. Defaults to 'default'.
+
+    Returns:
+        dict: the file and its statistics, or the file and the reason why it could not be loaded
+    """
+    record: dict = {'file': filename}
+    output = StringIO()
+    try:
+        # loading errors are printed before exiting, they are kept for the report
+        with redirect_stdout(output):
+            graph = Interactome(filename, method=method, write_clean=False)
+        record.update({name: STATISTICS[name](graph) for name in statistics})
+    except SystemExit:
+        record['error'] = output.getvalue().strip() or f"File {filename} could not be loaded."
+    except Exception as error:
+        record['error'] = f"File {filename} : {error}"
+    return record
+
+
+def batch_statistics(files: Iterable[str], statistics: Iterable[str] = tuple(STATISTICS), processes: int | None = None, method: str = 'default') -> Iterator[dict]:
+    """Loads interactome files concurrently in a pool of processes and computes their statistics.
+    Records are yielded as soon as a file is done, so slow files do not hold back fast ones.
+
+    Args:
+        files (Iterable[str]): paths to interactome files
+        statistics (Iterable[str], optional): names of the statistics, keys of STATISTICS. Defaults to all of them.
+        processes (int | None, optional): number of worker processes. Defaults to the number of CPUs.
+        method (str, optional): loading method of the files. Defaults to 'default'.
+
+    Raises:
+        ValueError: if a statistic is unknown
+
+    Yields:
+        Iterator[dict]: records of interactome_statistics, in order of completion
+    """
+    statistics = tuple(statistics)
+    unknown: list[str] = [name for name in statistics if name not in STATISTICS]
+    if unknown:
+        raise ValueError(
+            f"Unknown statistics {', '.join(unknown)}, expecting some of {', '.join(STATISTICS)}")
+    if processes == 1:
+        yield from (interactome_statistics(filename, statistics, method) for filename in files)
+        return
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(interactome_statistics, filename, statistics, method)
+                   for filename in files]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_report(records: Iterable[dict], file_out: str, statistics: Iterable[str] = tuple(STATISTICS)) -> int:
+    """Writes records of batch_statistics to a report as they come, in JSON if file_out ends with .json, else in TSV
+
+    Args:
+        records (Iterable[dict]): records of batch_statistics
+        file_out (str): path to the report
+        statistics (Iterable[str], optional): statistics of the records, columns of the TSV report. Defaults to all of them.
+
+    Returns:
+        int: number of records written
+    """
+    count: int = 0
+    with open(file_out, 'w') as handler:
+        if file_out.endswith('.json'):
+            handler.write('[')
+            for count, record in enumerate(records, 1):
+                handler.write(f"{',' if count > 1 else ''}\n  {json.dumps(record)}")
+                handler.flush()
+            handler.write('\n]\n')
+        else:
+            columns: list[str] = ['file', *statistics, 'error']
+            handler.write('\t'.join(columns) + '\n')
+            for count, record in enumerate(records, 1):
+                handler.write(
+                    '\t'.join(str(record.get(column, '')) for column in columns) + '\n')
+                handler.flush()
+    return count
@@ -1,15 +1,19 @@
-from argparse import ArgumentParser
-from interactome import Interactome
+from argparse import ArgumentParser, Namespace
+from sys import argv
+from interactome import Interactome, STATISTICS, batch_statistics, interaction_files, interactome_statistics, write_report
 from functools import partial
-import tkinter as tk
-import matplotlib.pyplot as plt
+import json
 
-if __name__ == "__main__":
 
-    parser = ArgumentParser()
-    parser.add_argument(
-        "file", help="Path to a interactome file", type=str)
-    args = parser.parse_args()
+def gui(args: Namespace) -> None:
+    """Opens a window of buttons to draw and explore the interactome of a file and two random graphs
+
+    Args:
+        args (Namespace): arguments of the command line
+    """
+    # Tk et matplotlib ne sont chargés que pour l'interface graphique
+    import tkinter as tk
+    import matplotlib.pyplot as plt
     # Initialisation d'un objet Interactome
     toy_graph: Interactome = Interactome(args.file)
     barabasi_albert_graph: Interactome = Interactome(
@@ -48,3 +52,107 @@ if __name__ == "__main__":
          for i, button in enumerate(button_list)]
         #root.attributes("-topmost", True)
         root.mainloop()
+
+
+def stats(args: Namespace) -> None:
+    """Prints statistics of the interactome of a file
+
+    Args:
+        args (Namespace): arguments of the command line
+    """
+    record: dict = interactome_statistics(args.file, args.stats)
+    if 'error' in record:
+        exit(record['error'])
+    if args.json:
+        print(json.dumps(record))
+    else:
+        print('\n'.join(f"{name}\t{value}" for name, value in record.items()))
+
+
+def cc(args: Namespace) -> None:
+    """Writes the connected components of the interactome of a file
+
+    Args:
+        args (Namespace): arguments of the command line
+    """
+    interactome: Interactome = Interactome(args.file, write_clean=False)
+    interactome.write_CC(args.output)
+    print(f"{interactome.count_CC()[0]} connected components written in {args.output}")
+
+
+def clean(args: Namespace) -> None:
+    """Writes the interactions of a file without duplicates nor self-loops
+
+    Args:
+        args (Namespace): arguments of the command line
+    """
+    interactome: Interactome = Interactome(args.file, fileout=args.output)
+    print(f"{interactome.count_edges()} interactions written in {args.output}, removed {interactome.cleaning_report['duplicates']} duplicates and {interactome.cleaning_report['self-loops']} self-loops")
+
+
+def batch(args: Namespace) -> None:
+    """Writes a report of statistics of many interactome files
+
+    Args:
+        args (Namespace): arguments of the command line
+    """
+    files: list[str] = interaction_files(args.pattern)
+    count: int = write_report(batch_statistics(
+        files, args.stats, args.processes), args.report, args.stats)
+    print(f"{count} interactomes summarized in {args.report}")
+
+
+if __name__ == "__main__":
+
+    parser = ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_gui = commands.add_parser(
+        "gui", help="Explore an interactome and random graphs in windows")
+    parser_gui.add_argument(
+        "file", help="Path to a interactome file", type=str)
+    parser_gui.set_defaults(func=gui)
+
+    parser_stats = commands.add_parser(
+        "stats", help="Print statistics of an interactome")
+    parser_stats.add_argument(
+        "file", help="Path to a interactome file", type=str)
+    parser_stats.add_argument(
+        "--stats", help="Statistics to compute", nargs='+', choices=list(STATISTICS), default=list(STATISTICS))
+    parser_stats.add_argument(
+        "--json", help="Print the statistics as JSON", action='store_true')
+    parser_stats.set_defaults(func=stats)
+
+    parser_cc = commands.add_parser(
+        "cc", help="Write the connected components of an interactome")
+    parser_cc.add_argument(
+        "file", help="Path to a interactome file", type=str)
+    parser_cc.add_argument(
+        "--output", help="Path to the components file", type=str, default="CC_file_out.txt")
+    parser_cc.set_defaults(func=cc)
+
+    parser_clean = commands.add_parser(
+        "clean", help="Write an interactome without duplicates nor self-loops")
+    parser_clean.add_argument(
+        "file", help="Path to a interactome file", type=str)
+    parser_clean.add_argument(
+        "--output", help="Path to the cleaned file", type=str, default="clean_int_graph.txt")
+    parser_clean.set_defaults(func=clean)
+
+    parser_batch = commands.add_parser(
+        "batch", help="Summarize many interactome files in a report")
+    parser_batch.add_argument(
+        "pattern", help="Folder or glob pattern of interactome files", type=str)
+    parser_batch.add_argument(
+        "--report", help="Path to the report, JSON if it ends with .json else TSV", type=str, default="report.tsv")
+    parser_batch.add_argument(
+        "--stats", help="Statistics computed on each file", nargs='+', choices=list(STATISTICS), default=list(STATISTICS))
+    parser_batch.add_argument(
+        "--processes", help="Number of processes loading the files, by default the number of CPUs", type=int)
+    parser_batch.set_defaults(func=batch)
+
+    # a file alone still opens the windows, as before subcommands existed
+    if len(argv) > 1 and argv[1] not in commands.choices and not argv[1].startswith('-'):
+        argv.insert(1, "gui")
+    args = parser.parse_args()
+    args.func(args)
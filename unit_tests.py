@@ -1,7 +1,11 @@
-from os import system
+from os import system, remove
+from tempfile import NamedTemporaryFile
 from unittest import TestCase
-from interactome import Interactome, is_interaction_file
-from numpy import ndarray, asarray
+from sys import executable
+from interactome import Interactome, batch_statistics, write_report, is_interaction_file, is_cache_fresh, interaction_file_errors, read_buffer
+from numpy import ndarray, asarray, int32
+from collections import Counter
+import json
 
 
 class TestObject(TestCase):
@@ -73,6 +77,11 @@ class TestObject(TestCase):
         self.assertEqual(self.interactome.proteins, [
                          'A', 'B', 'C', 'D', 'E', 'F', 'G'])
 
+    def test_object_prot_index_property(self):
+        "Tests if interactome.prot_index maps each protein to its position"
+        self.assertEqual(self.interactome.prot_index, {
+                         prot: i for i, prot in enumerate(self.interactome.proteins)})
+
     def test_object_mat_type(self):
         "Tests if interactome.mat is an array"
         self.assertTrue(isinstance(self.interactome.int_mat, ndarray))
@@ -82,6 +91,14 @@ class TestObject(TestCase):
         self.assertTrue((self.interactome.int_mat & asarray([[0, 1, 1, 0, 0, 0, 1], [1, 0, 1, 1, 0, 0, 1], [1, 1, 0, 0, 0, 0, 1], [
             0, 1, 0, 0, 1, 1, 0], [0, 0, 0, 1, 0, 0, 0], [0, 0, 0, 1, 0, 0, 0], [1, 1, 1, 0, 0, 0, 0]])).any())
 
+    def test_object_adjacency_property(self):
+        "Tests if interactome.adjacency is a well initialized CSR"
+        indptr, indices = self.interactome.adjacency
+        self.assertEqual(indices.dtype, int32)
+        self.assertEqual(indptr.tolist(), [0, 3, 7, 10, 13, 14, 15, 18])
+        self.assertEqual(indices.tolist(), [
+                         1, 2, 6, 0, 2, 3, 6, 0, 1, 6, 1, 4, 5, 3, 3, 0, 1, 2])
+
 
 class TestIO(TestCase):
 
@@ -107,6 +124,93 @@ class TestIO(TestCase):
         self.assertEqual(self.interactome.clean_interactome(
         ), ([['A', 'B'], ['A', 'C'], ['B', 'C'], ['C', 'D']], 4))
 
+    def test_stream_loader(self):
+        "Tests if the single pass loader builds the same interactome"
+        stream = Interactome("test_files/toy_example2.txt",
+                             method='stream', write_clean=False)
+        default = Interactome("test_files/toy_example2.txt", write_clean=False)
+        self.assertEqual((stream.int_list, stream.int_dict, stream.proteins, stream.degrees.tolist()),
+                         (default.int_list, default.int_dict, default.proteins, default.degrees.tolist()))
+
+    def test_stream_loader_incorrect_file(self):
+        "Tests if the single pass loader rejects a badly formatted file"
+        self.assertRaises(SystemExit, Interactome,
+                          "test_files/test_08.txt", method='stream', write_clean=False)
+
+    def test_parallel_loader(self):
+        "Tests if the multi-process loader builds the same interactome from several chunks"
+        parallel = Interactome("test_files/toy_example2.txt", method='parallel', kwargs={
+                               'processes': 2, 'chunk_size': 16}, write_clean=False, cache=False)
+        default = Interactome("test_files/toy_example2.txt", write_clean=False, cache=False)
+        self.assertEqual((parallel.int_list, parallel.int_dict, parallel.proteins, parallel.degrees.tolist(), parallel.cleaning_report),
+                         (default.int_list, default.int_dict, default.proteins, default.degrees.tolist(), default.cleaning_report))
+
+    def test_batch_statistics(self):
+        "Tests if a batch of files gives one record per file, errors included, in the report"
+        records = sorted(batch_statistics(["test_files/toy_example.txt", "test_files/test_08.txt"], [
+                         'vertices', 'edges', 'components'], processes=2), key=lambda record: record['file'])
+        self.assertEqual(records[1], {'file': "test_files/toy_example.txt",
+                         'vertices': 7, 'edges': 9, 'components': 1})
+        self.assertIn('error', records[0])
+        with NamedTemporaryFile(suffix='.json') as report:
+            self.assertEqual(write_report(records, report.name), 2)
+            self.assertEqual(json.load(open(report.name)), records)
+
+    def test_headless_import(self):
+        "Tests if plotting libraries are not imported with the module"
+        self.assertEqual(system(
+            f"{executable} -c \"import sys, interactome; sys.exit('matplotlib' in sys.modules or 'networkx' in sys.modules)\""), 0)
+
+    def test_draw_large(self):
+        "Tests if the large drawing keeps the k largest paths and reuses its layout"
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        graph = Interactome("test_files/toy_example_CC.txt", write_clean=False)
+        graph.draw(large=True, components=2)
+        edges, nodes = plt.gca().collections
+        positions = nodes.get_offsets().tolist()
+        graph.draw(large=True, components=2)
+        self.assertEqual((len(edges.get_segments()), len(positions), plt.gca().collections[1].get_offsets().tolist()),
+                         (9, 10, positions))
+
+    def test_compact_core(self):
+        "Tests if legacy views are only built on access, from the shared protein names"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False, cache=False)
+        self.assertFalse(hasattr(graph, '__dict__'))
+        self.assertEqual(graph._Interactome__int_list, None)
+        self.assertIs(graph.int_list[0][0], graph.proteins[0])
+
+    def test_cache(self):
+        "Tests if an interactome loaded from its cache is the parsed one"
+        parsed = Interactome("test_files/toy_example2.txt", write_clean=False)
+        self.assertTrue(is_cache_fresh("test_files/toy_example2.txt"))
+        cached = Interactome("test_files/toy_example2.txt", write_clean=False)
+        self.assertEqual((cached.int_list, cached.int_dict, cached.proteins, cached.degrees.tolist(), cached.cleaning_report),
+                         (parsed.int_list, parsed.int_dict, parsed.proteins, parsed.degrees.tolist(), parsed.cleaning_report))
+
+    def test_mmap(self):
+        "Tests if a memory-mapped interactome answers queries like a loaded one"
+        mapped = Interactome("test_files/toy_example.txt",
+                             method='mmap', write_clean=False)
+        self.assertEqual((mapped.count_edges(), mapped.get_degree('B'), mapped.get_neighbors('D')),
+                         (9, 4, ['B', 'E', 'F']))
+        self.assertEqual(mapped.int_list, [('A', 'B'), ('A', 'C'), ('B', 'C'), (
+            'B', 'D'), ('D', 'E'), ('D', 'F'), ('G', 'A'), ('G', 'C'), ('G', 'B')])
+
+    def test_from_edges(self):
+        "Tests if an interactome built from edges is the one read from file"
+        graph = Interactome.from_edges(asarray(
+            [('A', 'B'), ('A', 'C'), ('A', 'C'), ('B', 'C'), ('C', 'D')]))
+        self.assertEqual((graph.int_list, graph.proteins, graph.cleaning_report),
+                         (self.interactome.int_list, self.interactome.proteins, self.interactome.cleaning_report))
+
+    def test_cleaning_report(self):
+        "Tests if removed interactions are correctly counted"
+        self.interactome.clean_interactome()
+        self.assertEqual(self.interactome.cleaning_report, Counter(
+            {'duplicates': 1, 'self-loops': 0}))
+
 
 class TestMethods(TestCase):
 
@@ -130,9 +234,9 @@ class TestMethods(TestCase):
         self.interactomeCC = Interactome("test_files/toy_example_CC.txt")
         self.interactomeCC2 = Interactome("test_files/toy_example_CC2.txt")
         self.interactome_ER = Interactome(
-            "", method="erdos-renyi", kwargs={"n": 100, "q": 0.3})
+            "", method="erdos-renyi", kwargs={"n": 100, "q": 0.3}, write_clean=False)
         self.interactome_BA = Interactome(
-            "", method="barabasi-albert", kwargs={"m": 100})
+            "", method="barabasi-albert", kwargs={"m": 100}, write_clean=False)
 
     def test_file_does_not_exists(self):
         "Tests when file does not exists"
@@ -150,6 +254,13 @@ class TestMethods(TestCase):
         "Tests a file which is empty"
         self.assertFalse(is_interaction_file("test_files/test03.txt"))
 
+    def test_file_all_errors(self):
+        "Tests if every badly formatted line is reported"
+        errors = interaction_file_errors(
+            "test_files/test_07.txt", read_buffer("test_files/test_07.txt"))
+        self.assertEqual([str(error) for error in errors], [
+                         "File test_files/test_07.txt contains errors on lines 5, 8."])
+
     def test_default_file(self):
         "Tests the file which was given as toy example"
         self.assertTrue(is_interaction_file("test_files/toy_example.txt"))
@@ -190,6 +301,11 @@ class TestMethods(TestCase):
         "Tests if the number of degrees of a protein is well counted"
         self.assertEqual(self.interactome_Human.get_degree("1433B_HUMAN"), 49)'''
 
+    def test_degrees(self):
+        "Tests if the degree vector is aligned with proteins"
+        self.assertEqual(self.interactome.degrees.tolist(),
+                         [3, 4, 3, 3, 1, 1, 3])
+
     def test_get_degree_error(self):
         "Tests if the number of degrees of a protein which is non-exitent"
         self.assertRaises(ValueError, self.interactome.get_degree, "Y")
@@ -247,6 +363,13 @@ class TestMethods(TestCase):
         "Tests if the clustering coefficient of a protein is well calculated"
         self.assertEqual(round(self.interactome2.clustering("D"), 4), 0.3333)
 
+    def test_clustering_all(self):
+        "Tests if the clustering coefficients of all proteins are well calculated at once"
+        coefficients, transitivity, average = self.interactome2.clustering_all()
+        self.assertEqual([round(x, 4) for x in coefficients], [
+                         round(self.interactome2.clustering(prot), 4) for prot in self.interactome2.proteins])
+        self.assertEqual((round(transitivity, 4), round(average, 4)), (0.75, 0.8333))
+
     # TEST METHOD extract_CC
     def test_extract_CC1(self):
         self.assertEqual(self.interactomeCC.extract_CC('A'),
@@ -260,11 +383,104 @@ class TestMethods(TestCase):
         self.assertEqual(self.interactomeCC2.extract_CC('Z'),
                          ['Z','A', 'B', 'C', 'E', 'F'])
 
+    def test_extract_CC_error(self):
+        "Tests if extract_CC rejects a protein which is not in the graph"
+        self.assertRaises(ValueError, self.interactomeCC.extract_CC, 'ZZZ')
+
     #>>>>>>>>>>>>>>>>>>>>>>>>>>>> TEST METHOD extract_all_CC
     def test_extract_all_CC(self):
         self.assertEqual(self.interactomeCC.extract_all_CC(), {1: ['A', 'B', 'C', 'E', 'F'], 2: ['G', 'H'], 3: [
                          'I', 'J', 'K', 'L', 'M'], 4: ['O', 'P', 'Q', 'R'], 5: ['S', 'T'], 6: ['U', 'V', 'W']})
 
+    def test_extract_CC_long_chain(self):
+        "Tests if a path longer than the recursion limit is extracted"
+        with NamedTemporaryFile('w', suffix='.txt', delete=False) as handler:
+            handler.write('\n'.join(
+                ['5000']+[f"P{i:05d} P{i+1:05d}" for i in range(5000)]))
+        chain = Interactome(handler.name, cache=False, write_clean=False)
+        remove(handler.name)
+        self.assertEqual(len(chain.extract_CC('P00000')), 5001)
+        self.assertEqual(chain.count_CC(), (1, [(1, 5001)]))
+
+    def test_label_CC_cache(self):
+        "Tests if path labels are computed once and dropped when interactions are added"
+        graph = Interactome("test_files/toy_example_CC.txt", write_clean=False)
+        labels = graph.label_CC()
+        self.assertIs(graph.label_CC(), labels)
+        graph.barabasi_albert_graph(2)
+        self.assertIsNot(graph.label_CC(), labels)
+        self.assertEqual(len(graph.label_CC()), 23)
+
+    def test_label_CC_generated_proteins(self):
+        "Tests if path labels account for proteins generated after they are computed"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.label_CC()
+        graph.erdos_renyi_graph(3, 1.0)
+        self.assertEqual(graph.count_CC(), (4, [(1, 7), (2, 1), (3, 1), (4, 1)]))
+
+    def test_add_remove_edge(self):
+        "Tests if adding then removing interactions keeps degrees, neighbors and paths up to date"
+        graph = Interactome("test_files/toy_example_CC.txt", write_clean=False)
+        nb_CC, edges = graph.count_CC()[0], graph.count_edges()
+        a, b = graph.extract_all_CC()[1][0], graph.extract_all_CC()[2][0]
+        self.assertTrue(graph.add_edge(a, b))
+        self.assertFalse(graph.add_edge(b, a))
+        graph.add_node("NEW")
+        self.assertEqual((graph.count_CC()[0], graph.count_edges(), graph.get_degree("NEW"), graph.int_list[-1]),
+                         (nb_CC, edges+1, 0, (a, b)))
+        self.assertEqual(graph.add_edges([("NEW", "NEW2"), ("NEW2", "NEW"), ("NEW", "NEW")]), 1)
+        self.assertIn(b, graph.get_neighbors(a))
+        graph.remove_edge(b, a)
+        self.assertEqual((graph.count_CC()[0], graph.count_edges(), graph.get_degree(a)),
+                         (nb_CC+1, edges+1, 3))
+        self.assertNotIn(b, graph.get_neighbors(a))
+        self.assertRaises(ValueError, graph.remove_edge, a, b)
+
+    def test_remove_edge_split(self):
+        "Tests if removing interactions keeps path labels when the path holds, and splits them when it does not"
+        graph = Interactome.from_edges([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'A'), ('D', 'E')])
+        labels = graph.label_CC()
+        graph.remove_edge('A', 'B')
+        self.assertIs(graph.label_CC(), labels)
+        self.assertEqual((graph.get_neighbors('A'), graph.get_neighbors('B')), (['D'], ['C']))
+        graph.remove_edge('C', 'D')
+        self.assertEqual(graph.label_CC().tolist(), [1, 2, 2, 1, 1])
+        graph.add_edge('E', 'F')
+        self.assertEqual((graph.count_CC(), graph.get_neighbors('E')), ((2, [(1, 4), (2, 2)]), ['D', 'F']))
+        self.assertEqual(graph.neighbors_many(['A', 'E', 'F', 'C']),
+                         {'A': ['D'], 'E': ['D', 'F'], 'F': ['E'], 'C': ['B']})
+        self.assertEqual([array.tolist() for array in graph.adjacency],
+                         [[0, 1, 2, 3, 5, 7, 8], [3, 2, 1, 0, 4, 3, 5, 4]])
+
+    def test_read_interaction_file_mat(self):
+        "Tests if the matrix read from int_dict leaves the ids of a changed graph as they are"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.add_edge("AA", "E")
+        matrix, proteins = graph.read_interaction_file_mat()
+        self.assertEqual((proteins, matrix[1].tolist(), matrix.sum()),
+                         (['A', 'AA', 'B', 'C', 'D', 'E', 'F', 'G'], [0, 0, 0, 0, 0, 1, 0, 0], 20))
+        self.assertEqual((graph.get_degree("AA"), graph.get_degree("G"), graph.int_list[-1], graph.proteins[-1]),
+                         (1, 3, ('AA', 'E'), "AA"))
+
+    def test_set_int_mat(self):
+        "Tests if setting int_mat replaces the interactions of the graph and keeps its proteins"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.count_CC()
+        matrix = graph.int_mat
+        matrix[0], matrix[:, 0] = 0, 0
+        graph.int_mat = matrix
+        self.assertEqual((graph.get_neighbors('A'), graph.get_degree('A'), graph.count_edges(), graph.count_CC()[0],
+                          graph.shortest_path('B', 'G'), graph.int_list[0]),
+                         ([], 0, 6, 2, ['B', 'G'], ('B', 'C')))
+        self.assertRaises(ValueError, setattr, graph, 'int_mat', matrix[1:, 1:])
+
+    def test_set_int_list(self):
+        "Tests if setting int_list replaces the interactions of the graph"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.int_list = [('A', 'B'), ('B', 'A'), ('B', 'C')]
+        self.assertEqual((graph.count_edges(), graph.get_degree('A'), graph.get_neighbors('B'), graph.proteins, graph.int_dict),
+                         (2, 1, ['A', 'C'], ['A', 'B', 'C'], {'A': ['B'], 'B': ['C']}))
+
     # TEST METHOD get_neighbors
     def test_get_neighbors1(self):
         self.assertEqual(self.interactome2.get_neighbors('A'), ['B', 'C', 'G'])
@@ -272,6 +488,66 @@ class TestMethods(TestCase):
     def test_get_neighbors2(self):
         self.assertEqual(self.interactome2.get_neighbors('F'), ['D', 'E'])
 
+    def test_get_neighbors_error(self):
+        "Tests the neighbors of a protein which is non-existent"
+        self.assertRaises(ValueError, self.interactome2.get_neighbors, "Y")
+
+    def test_neighbors_many(self):
+        "Tests if the neighbors of many proteins are extracted at once"
+        self.assertEqual(self.interactome2.neighbors_many(['A', 'F']), {
+                         'A': ['B', 'C', 'G'], 'F': ['D', 'E']})
+
+    # TEST METHODS distances and shortest_path
+    def test_distances(self):
+        "Tests if distances are the number of interactions on a shortest path, in proteins order"
+        self.assertEqual(self.interactome.distances('E').tolist(),
+                         [3, 2, 3, 1, 0, 2, 3])
+        self.assertEqual(self.interactome.distances_many(['E', 'A'], processes=2, chunk_size=1).tolist(),
+                         [[3, 2, 3, 1, 0, 2, 3], [0, 1, 1, 2, 3, 3, 1]])
+
+    def test_shortest_path(self):
+        "Tests if a shortest path links both proteins, and if there is none between paths"
+        self.assertEqual(self.interactome.shortest_path('F', 'A'),
+                         ['F', 'D', 'B', 'A'])
+        labels = self.interactomeCC.extract_all_CC()
+        self.assertEqual(self.interactomeCC.shortest_path(
+            labels[1][0], labels[2][0]), [])
+
+    def test_distance_statistics(self):
+        "Tests if exact statistics are computed per path, and if sampled ones bound the exact values"
+        statistics = self.interactome.distance_statistics(processes=2, chunk_size=2)
+        self.assertEqual((statistics[1]['diameter'], statistics[1]['eccentricity'][0].tolist(), round(statistics[1]['average'], 4)),
+                         ((3, 3), [3, 2, 3, 2, 3, 3, 3], 1.8571))
+        self.assertEqual(len(self.interactomeCC.distance_statistics()), 6)
+        sampled = self.interactome.distance_statistics(
+            exact_limit=3, samples=3, seed=0)[1]
+        lower, upper = sampled['eccentricity']
+        self.assertTrue(sampled['diameter'][0] <= 3 <= sampled['diameter'][1])
+        self.assertTrue(all(lower <= statistics[1]['eccentricity'][0]) and all(
+            upper >= statistics[1]['eccentricity'][0]))
+
+    # TEST METHODS of centrality
+    def test_centralities(self):
+        "Tests if centralities are aligned with proteins, with the values of networkx on a toy example"
+        self.assertEqual([round(x, 4) for x in self.interactome.betweenness(processes=2, chunk_size=2)],
+                         [0.0, 0.6, 0.0, 0.6, 0.0, 0.0, 0.0])
+        self.assertEqual([round(x, 4) for x in self.interactome.closeness()],
+                         [0.5455, 0.75, 0.5455, 0.6667, 0.4286, 0.4286, 0.5455])
+        self.assertEqual([round(x, 4) for x in self.interactome.pagerank()],
+                         [0.1493, 0.2036, 0.1493, 0.1951, 0.0767, 0.0767, 0.1493])
+        self.assertEqual(self.interactome.degree_centrality().tolist()[1], 4/6)
+
+    def test_betweenness_sampled(self):
+        "Tests if betweenness sampled from all proteins is the exact one"
+        self.assertEqual(self.interactomeCC.betweenness(k=self.interactomeCC.count_vertices(), seed=1).round(8).tolist(),
+                         self.interactomeCC.betweenness().round(8).tolist())
+
+    def test_distance_statistics_few_proteins(self):
+        "Tests if a sampled path smaller than the number of samples is searched from all its proteins"
+        statistics = self.interactome.distance_statistics(exact_limit=2)[1]
+        self.assertEqual((statistics['sources'], statistics['diameter'], round(statistics['average'], 4)),
+                         (7, (3, 3), 1.8571))
+
     # TEST METHOD compute_CC
     def test_compute_CC(self):
         self.assertEqual(self.interactomeCC.compute_CC(), [(1, 'A'), (1, 'B'), (1, 'C'), (1, 'E'), (1, 'F'), (2, 'G'), (2, 'H'), (3, 'I'), (
@@ -287,11 +563,44 @@ class TestMethods(TestCase):
         distribution = self.interactome_ER.get_ave_degree()
         self.assertTrue(27 < round(distribution) < 33)
 
+    def test_erdos_renyi_graph_complete(self):
+        "Tests if a probability of 1 gives the complete graph"
+        graph = Interactome("", method="erdos-renyi",
+                            kwargs={"n": 20, "q": 1.0, "seed": 0}, write_clean=False)
+        self.assertEqual(graph.count_edges(), 190)
+        self.assertEqual(graph.density(), 1.0)
+
     # TEST METHOD barabasi_albert_graph
     def test_barabasi_albert_graph(self):
         distribution = self.interactome_BA.get_ave_degree()
         self.assertTrue(1.8 < round(distribution) < 2.2)
 
+    def test_barabasi_albert_graph_too_small(self):
+        "Tests if a Barabasi-Albert graph needs at least two nodes to start from"
+        self.assertRaises(ValueError, Interactome, "", method="barabasi-albert",
+                          kwargs={"m": 1}, write_clean=False)
+
+    def test_barabasi_albert_graph_edges_per_node(self):
+        "Tests if each added node gets the requested number of interactions"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.barabasi_albert_graph(50, edges_per_node=3, seed=1)
+        self.assertEqual(graph.count_edges(), 9 + 50*3)
+        self.assertEqual(graph.degrees.tolist(), graph.count_degrees().tolist())
+
+    def test_barabasi_albert_graph_seed(self):
+        "Tests if seeded graphs are reproducible"
+        graphs = [Interactome("", method="barabasi-albert",
+                              kwargs={"m": 50, "seed": 42}, write_clean=False) for _ in range(2)]
+        self.assertEqual(graphs[0].int_list, graphs[1].int_list)
+
+    def test_generated_names(self):
+        "Tests if generated proteins get unique names, from a counter when a prefix is given"
+        graph = Interactome("test_files/toy_example.txt", write_clean=False)
+        graph.barabasi_albert_graph(3, prefix="P")
+        self.assertEqual(graph.proteins[-3:], ['P7', 'P8', 'P9'])
+        graph.barabasi_albert_graph(500)
+        self.assertEqual(len(set(graph.proteins)), 510)
+
 
 if __name__ == "__main__":
     system("python -m unittest -v unit_tests.py")
\ No newline at end of file